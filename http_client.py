@@ -0,0 +1,136 @@
+"""
+HTTP client helpers shared by the trend collectors
+Provides a process-wide aiohttp session, caps concurrent requests per host,
+backs off on HTTP 429 and caches results
+"""
+
+import asyncio
+import functools
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUESTS_PER_HOST = 8
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 60
+RESULT_CACHE_TTL = 300  # Trends don't change second-to-second
+
+# One semaphore per host and event loop, shared by every RateLimitedSession on that
+# loop (asyncio primitives can't be shared across loops)
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+# One long-lived session per event loop (sessions can't be shared across loops)
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session for the running event loop
+
+    Keeping one session alive reuses TCP/TLS connections and cached DNS
+    lookups across collectors instead of paying for them on every fetch.
+    Must be called from inside a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """Close the shared session of the running event loop, if any"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@asynccontextmanager
+async def shared_session():
+    """Borrow the shared, rate-limited session (it stays open on exit)"""
+    yield RateLimitedSession(get_session())
+
+
+def cache_result(ttl: float = RESULT_CACHE_TTL):
+    """
+    Cache a no-argument coroutine method's result on the instance for `ttl` seconds
+
+    Empty results are not cached so a failed fetch is retried on the next call.
+    """
+    def decorator(func):
+        attr = f"_cached_{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(self):
+            cached = getattr(self, attr, None)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return list(cached[1])
+            result = await func(self)
+            if result:
+                setattr(self, attr, (time.monotonic(), list(result)))
+            return result
+        return wrapper
+    return decorator
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff"""
+    retry_after = response.headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return min(int(retry_after), MAX_BACKOFF_SECONDS)
+    return min(2 ** attempt, MAX_BACKOFF_SECONDS)
+
+
+class RateLimitedSession:
+    """Wrap an aiohttp session with a per-host concurrency limit and 429 backoff"""
+
+    def __init__(self, session: aiohttp.ClientSession, max_per_host: int = MAX_REQUESTS_PER_HOST):
+        self._session = session
+        self._max_per_host = max_per_host
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(self._max_per_host)
+        return semaphore
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs):
+        """
+        GET a URL, retrying on 429 Too Many Requests
+
+        Usage mirrors aiohttp: `async with rls.get(url) as response:`
+        """
+        async with self._semaphore(url):
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._session.get(url, **kwargs)
+                if response.status != 429 or attempt == MAX_RETRIES:
+                    break
+                delay = _retry_delay(response, attempt)
+                response.release()
+                logger.warning(f"429 from {urlparse(url).netloc}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+            try:
+                yield response
+            finally:
+                response.release()
@@ -17,8 +17,10 @@ load_dotenv()
 from real_trend_collectors import (
     TwitterTrendsCollector,
     RedditTrendingCollector,
-    GetDayTrendsCollector
+    GetDayTrendsCollector,
+    dedupe_trends
 )
+from http_client import close_session
 from wikipedia_finder import WikipediaFinder
 from url_tracker import URLTracker
 from web_monitor import WebMonitor
@@ -111,17 +113,18 @@ class TrendAgent:
     async def collect_trends(self) -> List[str]:
         """Collect trends from all platforms and use LLM to prioritize by relevance"""
         logger.info("Starting trend collection from all platforms...")
-        all_trends = set()
+        all_trends = []
         
         for collector in self.collectors:
             try:
                 trends = await collector.get_us_trends()
-                all_trends.update(trends)
+                all_trends.extend(trends)
                 logger.info(f"{collector.__class__.__name__}: Found {len(trends)} trends")
             except Exception as e:
                 logger.error(f"Error collecting from {collector.__class__.__name__}: {e}")
         
-        trends_list = list(all_trends)
+        # Drop exact and near-duplicate titles before anything reaches roll.wiki/Twitter
+        trends_list = dedupe_trends(all_trends)
         logger.info(f"Total unique trends collected: {len(trends_list)}")
         
         # Return all trends without filtering
@@ -729,7 +732,10 @@ async def main():
     # Make agent globally accessible for dashboard
     dashboard.trend_agent = agent
     
-    await agent.run()
+    try:
+        await agent.run()
+    finally:
+        await close_session()
 
 
 def recreate_video():
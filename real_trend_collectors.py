@@ -5,14 +5,72 @@ Haber başlıkları DEĞİL, gerçek trend keyword'leri alır
 
 import asyncio
 import logging
+import string
 from typing import List
-import aiohttp
 from bs4 import BeautifulSoup
+from http_client import cache_result, shared_session
 from pytrends.request import TrendReq
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Strips ASCII punctuation in a single C-level pass
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+
+def _normalize_trend(trend: str) -> str:
+    """Normalize a trend title for exact-duplicate detection (casefolded, so non-ASCII too)"""
+    return " ".join(trend.casefold().translate(_PUNCTUATION_TABLE).split())
+
+
+def dedupe_trends(trends: List[str], threshold: float = 0.7) -> List[str]:
+    """
+    Remove duplicate and near-duplicate trends collected from several platforms
+    
+    Layer 1 drops exact duplicates after normalization (case, punctuation, whitespace).
+    Layer 2 compares token-set signatures and drops titles whose Jaccard similarity
+    with an already kept title is >= threshold (same story, different outlet).
+    Only kept titles sharing at least one token are compared (an inverted index
+    on tokens), so unrelated titles cost nothing.
+    The first occurrence wins, so collectors listed first keep priority.
+    
+    Args:
+        trends: Trend titles in collector priority order
+        threshold: Jaccard similarity above which two titles are considered the same
+        
+    Returns:
+        Deduplicated trends, original order preserved
+    """
+    seen = set()
+    kept = []
+    signatures = []
+    by_token = {}  # token -> indexes of kept signatures containing it
+    
+    for trend in trends:
+        normalized = _normalize_trend(trend)
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        
+        signature = frozenset(normalized.split())
+        candidates = set()
+        for token in signature:
+            candidates.update(by_token.get(token, ()))
+        if any(
+            len(signature & signatures[i]) / len(signature | signatures[i]) >= threshold
+            for i in candidates
+        ):
+            continue
+        
+        for token in signature:
+            by_token.setdefault(token, []).append(len(signatures))
+        signatures.append(signature)
+        kept.append(trend)
+    
+    if len(kept) < len(trends):
+        logger.info(f"Deduplicated trends: {len(trends)} → {len(kept)}")
+    return kept
+
 
 class BaseTrendCollector:
     """Base class for trend collectors"""
@@ -38,6 +96,7 @@ class GoogleTrendsCollector(BaseTrendCollector):
         except Exception as e:
             logger.error(f"Failed to initialize PyTrends: {e}")
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get real trending searches from Google Trends"""
         # Try RSS feed first (more reliable)
@@ -78,18 +137,18 @@ class GoogleTrendsCollector(BaseTrendCollector):
         """Fallback: Get trends from Google Trends RSS"""
         url = "https://trends.google.com/trends/trendingsearches/daily/rss?geo=US"
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, timeout=15) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    soup = BeautifulSoup(text, 'xml')
+                    raw = await response.read()
+                    soup = BeautifulSoup(raw, 'xml')
                     
-                    trends = []
-                    for item in soup.find_all('title'):
-                        title = item.text.strip()
-                        # Skip the feed title
-                        if title and title != "Daily Search Trends":
-                            trends.append(title)
+                    # Skip the feed title
+                    trends = [
+                        title
+                        for item in soup.find_all('title')
+                        if (title := item.text.strip()) and title != "Daily Search Trends"
+                    ]
                     
                     return trends[:20]
         return []
@@ -98,6 +157,7 @@ class GoogleTrendsCollector(BaseTrendCollector):
 class TwitterTrendsCollector(BaseTrendCollector):
     """Collect REAL trends from Twitter using trends24.in"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get real Twitter/X trends"""
         try:
@@ -120,14 +180,14 @@ class TwitterTrendsCollector(BaseTrendCollector):
         """Get trends from trends24.in"""
         url = "https://trends24.in/united-states/"
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
             async with session.get(url, headers=headers, timeout=15) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    soup = BeautifulSoup(text, 'html.parser')
+                    raw = await response.read()
+                    soup = BeautifulSoup(raw, 'html.parser')
                     
                     trends = []
                     
@@ -160,21 +220,21 @@ class TwitterTrendsCollector(BaseTrendCollector):
         """Get trends from getdaytrends.com"""
         url = "https://getdaytrends.com/united-states/"
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             async with session.get(url, headers=headers, timeout=15) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    soup = BeautifulSoup(text, 'html.parser')
+                    raw = await response.read()
+                    soup = BeautifulSoup(raw, 'html.parser')
                     
-                    trends = []
                     # Look for trending topics with various selectors
-                    for element in soup.select('a.topic, .trend-link, .trend-item'):
-                        trend_text = element.get_text(strip=True)
-                        if trend_text and not trend_text.startswith('#'):
-                            trends.append(trend_text)
+                    trends = [
+                        trend_text
+                        for element in soup.select('a.topic, .trend-link, .trend-item')
+                        if (trend_text := element.get_text(strip=True)) and not trend_text.startswith('#')
+                    ]
                     
                     if trends:
                         logger.info(f"GetDayTrends: Found {len(trends)} Twitter trends")
@@ -185,19 +245,20 @@ class TwitterTrendsCollector(BaseTrendCollector):
 class TikTokTrendsCollector(BaseTrendCollector):
     """Collect trends from TikTok Discover page"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get TikTok trending hashtags and sounds"""
         try:
             url = "https://www.tiktok.com/discover"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
                         trends = []
                         
@@ -223,12 +284,13 @@ class TikTokTrendsCollector(BaseTrendCollector):
 class RedditTrendingCollector(BaseTrendCollector):
     """Extract trending KEYWORDS from Reddit hot posts"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Extract trending keywords from Reddit"""
         try:
             url = "https://www.reddit.com/r/all/hot/.json?limit=50"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'TrendCollector/2.0'
                 }
@@ -237,12 +299,11 @@ class RedditTrendingCollector(BaseTrendCollector):
                         data = await response.json()
                         
                         # Collect all post titles
-                        titles = []
-                        for post in data.get('data', {}).get('children', []):
-                            post_data = post.get('data', {})
-                            title = post_data.get('title', '').strip()
-                            if title:
-                                titles.append(title)
+                        titles = [
+                            title
+                            for post in data.get('data', {}).get('children', [])
+                            if (title := post.get('data', {}).get('title', '').strip())
+                        ]
                         
                         # Extract keywords (simple approach)
                         trends = self._extract_keywords(titles)
@@ -299,20 +360,21 @@ class RedditTrendingCollector(BaseTrendCollector):
 class BingTrendsCollector(BaseTrendCollector):
     """Collect trends from Bing by searching 'trending now'"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending topics from Bing search results"""
         try:
             # Search for "trending now" on Bing and extract keywords
             url = "https://www.bing.com/search?q=trending+now+2024"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
                         trends = []
                         # Extract from search result titles
@@ -338,20 +400,21 @@ class BingTrendsCollector(BaseTrendCollector):
 class YandexTrendsCollector(BaseTrendCollector):
     """Collect trends from Yandex by searching trending topics"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending topics from Yandex search"""
         try:
             # Search for trending topics on Yandex
             url = "https://yandex.com/search/?text=trending+now+2024"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
                         trends = []
                         # Extract keywords from search results
@@ -377,20 +440,21 @@ class YandexTrendsCollector(BaseTrendCollector):
 class BraveSearchTrendsCollector(BaseTrendCollector):
     """Collect trends from Brave Search"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending topics from Brave Search"""
         try:
             # Search for trending topics on Brave
             url = "https://search.brave.com/search?q=trending+now+2024"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
                         trends = []
                         # Extract keywords from search results
@@ -416,19 +480,20 @@ class BraveSearchTrendsCollector(BaseTrendCollector):
 class GetDayTrendsCollector(BaseTrendCollector):
     """Collect trending hashtags from GetDayTrends.com"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending Twitter hashtags from GetDayTrends"""
         try:
             url = "https://getdaytrends.com/united-states/"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
                         trends = []
                         
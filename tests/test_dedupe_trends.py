@@ -0,0 +1,35 @@
+"""
+Tests for dedupe_trends (exact and near-duplicate trend removal)
+"""
+
+from real_trend_collectors import dedupe_trends
+
+
+def test_exact_duplicates_ignore_case_punctuation_and_spacing():
+    trends = ["Taylor Swift", "taylor  swift!", "TAYLOR SWIFT."]
+    assert dedupe_trends(trends) == ["Taylor Swift"]
+
+
+def test_non_ascii_case_is_folded():
+    trends = ["Économie Française", "économie française", "STRASSE", "straße"]
+    assert dedupe_trends(trends) == ["Économie Française", "STRASSE"]
+
+
+def test_near_duplicates_are_dropped():
+    trends = ["Taylor Swift new album", "Taylor Swift new album tour"]
+    assert dedupe_trends(trends) == ["Taylor Swift new album"]
+
+
+def test_distinct_trends_keep_their_order():
+    trends = ["World Series", "Election results", "Taylor Swift", "Super Bowl"]
+    assert dedupe_trends(trends) == trends
+
+
+def test_partial_overlap_below_threshold_is_kept():
+    trends = ["Apple earnings", "Apple event"]
+    assert dedupe_trends(trends) == trends
+    assert dedupe_trends(trends, threshold=0.3) == ["Apple earnings"]
+
+
+def test_empty_titles_are_dropped():
+    assert dedupe_trends(["", "...", "News"]) == ["News"]
@@ -0,0 +1,128 @@
+"""
+Tests for the shared HTTP helpers (result cache, 429 backoff)
+"""
+
+import asyncio
+
+import pytest
+
+import http_client
+from http_client import MAX_RETRIES, RateLimitedSession, cache_result
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the result cache"""
+    now = [1000.0]
+    monkeypatch.setattr(http_client.time, 'monotonic', lambda: now[0])
+    return now
+
+
+class Collector:
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    @cache_result(ttl=60)
+    async def get_trends(self):
+        self.calls += 1
+        return self.results.pop(0)
+
+
+def test_cache_result_reuses_result_within_ttl(clock):
+    collector = Collector([["a", "b"], ["c"]])
+    assert asyncio.run(collector.get_trends()) == ["a", "b"]
+    clock[0] += 59
+    assert asyncio.run(collector.get_trends()) == ["a", "b"]
+    assert collector.calls == 1
+
+
+def test_cache_result_expires_after_ttl(clock):
+    collector = Collector([["a", "b"], ["c"]])
+    asyncio.run(collector.get_trends())
+    clock[0] += 60
+    assert asyncio.run(collector.get_trends()) == ["c"]
+    assert collector.calls == 2
+
+
+def test_cache_result_does_not_cache_empty_results(clock):
+    collector = Collector([[], ["a"]])
+    assert asyncio.run(collector.get_trends()) == []
+    assert asyncio.run(collector.get_trends()) == ["a"]
+    assert collector.calls == 2
+
+
+def test_cache_result_returns_a_copy(clock):
+    collector = Collector([["a"]])
+    asyncio.run(collector.get_trends()).append("mutated")
+    assert asyncio.run(collector.get_trends()) == ["a"]
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = 0
+
+    async def get(self, url, **kwargs):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+    monkeypatch.setattr(http_client.asyncio, 'sleep', sleep)
+    return delays
+
+
+async def fetch_status(session):
+    async with RateLimitedSession(session).get("https://example.com/trends") as response:
+        return response.status
+
+
+def test_retries_429_after_retry_after(sleeps):
+    throttled = FakeResponse(429, {'Retry-After': '7'})
+    session = FakeSession([throttled, FakeResponse(200)])
+    assert asyncio.run(fetch_status(session)) == 200
+    assert sleeps == [7]
+    assert throttled.released
+    assert session.requests == 2
+
+
+def test_retry_after_is_capped(sleeps):
+    session = FakeSession([FakeResponse(429, {'Retry-After': '3600'}), FakeResponse(200)])
+    asyncio.run(fetch_status(session))
+    assert sleeps == [http_client.MAX_BACKOFF_SECONDS]
+
+
+def test_backs_off_exponentially_without_retry_after(sleeps):
+    session = FakeSession([FakeResponse(429), FakeResponse(429), FakeResponse(200)])
+    assert asyncio.run(fetch_status(session)) == 200
+    assert sleeps == [1, 2]
+
+
+def test_gives_up_after_max_retries(sleeps):
+    session = FakeSession([FakeResponse(429) for _ in range(MAX_RETRIES + 1)])
+    assert asyncio.run(fetch_status(session)) == 429
+    assert len(sleeps) == MAX_RETRIES
+    assert session.requests == MAX_RETRIES + 1
+
+
+def test_response_is_released_on_exit(sleeps):
+    response = FakeResponse(200)
+    asyncio.run(fetch_status(FakeSession([response])))
+    assert response.released
@@ -0,0 +1,29 @@
+"""
+Tests for _wrap_lines (word wrapping of on-screen text)
+"""
+
+from video_creator import _wrap_lines
+
+TEXT = "The quick brown fox jumps over the lazy dog near the river bank"
+
+
+def test_words_are_kept_in_order():
+    lines = _wrap_lines(TEXT, 300, 40)
+    assert " ".join(lines).split() == TEXT.split()
+
+
+def test_wide_enough_text_fits_on_one_line():
+    assert _wrap_lines(TEXT, 100000, 40) == (TEXT,)
+
+
+def test_narrow_width_gives_one_word_per_line():
+    assert _wrap_lines(TEXT, 1, 40) == tuple(TEXT.split())
+
+
+def test_lines_get_longer_as_width_grows():
+    assert len(_wrap_lines(TEXT, 800, 40)) <= len(_wrap_lines(TEXT, 300, 40))
+
+
+def test_empty_text_has_no_lines():
+    assert _wrap_lines("", 300, 40) == ()
+    assert _wrap_lines("   ", 300, 40) == ()
@@ -0,0 +1,85 @@
+"""
+Tests for the YouTube uploader helpers (UTF-16 clipping, Shorts hashtag, quota bucket)
+"""
+
+import pytest
+
+import youtube_uploader
+from youtube_uploader import _clip_utf16, _has_shorts_tag, _QuotaBucket
+
+
+def utf16_units(text: str) -> int:
+    return len(text.encode('utf-16-le')) // 2
+
+
+def test_clip_utf16_keeps_short_text():
+    assert _clip_utf16("Hello world", 100) == "Hello world"
+
+
+def test_clip_utf16_cuts_bmp_text_at_the_limit():
+    assert _clip_utf16("a" * 150, 100) == "a" * 100
+
+
+def test_clip_utf16_counts_astral_characters_as_two_units():
+    clipped = _clip_utf16("😀" * 60, 100)
+    assert clipped == "😀" * 50
+    assert utf16_units(clipped) == 100
+
+
+def test_clip_utf16_never_splits_a_surrogate_pair():
+    # 'ab' takes 2 units; the emoji would need 2 more but only 1 is left
+    assert _clip_utf16("ab😀", 3) == "ab"
+    assert _clip_utf16("ab😀", 4) == "ab😀"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; time.sleep advances it instead of blocking"""
+    now = [1000.0]
+    monkeypatch.setattr(youtube_uploader.time, 'monotonic', lambda: now[0])
+
+    def sleep(seconds):
+        now[0] += seconds
+    monkeypatch.setattr(youtube_uploader.time, 'sleep', sleep)
+    return now
+
+
+def test_quota_bucket_allows_bursts_up_to_capacity(clock):
+    bucket = _QuotaBucket(capacity=10000, rate=10000 / 86400)
+    assert all(bucket.consume(1600) for _ in range(6))
+
+
+def test_quota_bucket_refuses_past_capacity(clock):
+    bucket = _QuotaBucket(capacity=10000, rate=10000 / 86400)
+    for _ in range(6):
+        bucket.consume(1600)
+    start = clock[0]
+    # 400 units left; 1200 more would take hours to refill
+    assert bucket.consume(1600) is False
+    assert clock[0] == start  # Refused without sleeping
+
+
+def test_quota_bucket_waits_for_a_short_refill(clock):
+    bucket = _QuotaBucket(capacity=100, rate=1.0)
+    assert bucket.consume(100)
+    start = clock[0]
+    assert bucket.consume(30, max_wait=60)
+    assert clock[0] - start == pytest.approx(30)
+
+
+def test_quota_bucket_refills_over_time(clock):
+    bucket = _QuotaBucket(capacity=100, rate=1.0)
+    assert bucket.consume(100)
+    clock[0] += 100
+    assert bucket.consume(100, max_wait=0)
+
+
+def test_shorts_tag_is_found_in_any_case():
+    assert _has_shorts_tag("Great video #Shorts")
+    assert _has_shorts_tag("#SHORTS, #news")
+    assert _has_shorts_tag("Watch this #shorts!")
+
+
+def test_longer_hashtags_do_not_count_as_shorts_tag():
+    assert not _has_shorts_tag("A #shortstory about #shortsfilm")
+    assert not _has_shorts_tag("No tags here")
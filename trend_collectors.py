@@ -6,8 +6,8 @@ Each collector implements get_us_trends() method to fetch trending topics in the
 import asyncio
 import logging
 from typing import List
-import aiohttp
 from bs4 import BeautifulSoup
+from http_client import cache_result, shared_session
 import json
 
 logger = logging.getLogger(__name__)
@@ -24,22 +24,23 @@ class BaseTrendCollector:
 class GoogleTrendsCollector(BaseTrendCollector):
     """Collect trends from Google Trends"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get US trends from Google Trends"""
         try:
             url = "https://trends.google.com/trends/trendingsearches/daily/rss?geo=US"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'xml')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'xml')
                         
-                        trends = []
-                        for item in soup.find_all('item'):
-                            title = item.find('title')
-                            if title:
-                                trends.append(title.text.strip())
+                        trends = [
+                            title.text.strip()
+                            for item in soup.find_all('item')
+                            if (title := item.find('title'))
+                        ]
                         
                         return trends[:20]  # Limit to top 20
         except Exception as e:
@@ -51,26 +52,27 @@ class GoogleTrendsCollector(BaseTrendCollector):
 class TwitterTrendsCollector(BaseTrendCollector):
     """Collect trends from Twitter/X"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get US trends from Twitter - using getdaytrends.com as alternative"""
         try:
             url = "https://getdaytrends.com/united-states/"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
-                        trends = []
                         # Look for trending topics
-                        for element in soup.find_all('a', class_='topic'):
-                            trend_text = element.text.strip()
-                            if trend_text and not trend_text.startswith('#'):
-                                trends.append(trend_text)
+                        trends = [
+                            trend_text
+                            for element in soup.find_all('a', class_='topic')
+                            if (trend_text := element.text.strip()) and not trend_text.startswith('#')
+                        ]
                         
                         return trends[:15]  # Limit to top 15
         except Exception as e:
@@ -82,12 +84,13 @@ class TwitterTrendsCollector(BaseTrendCollector):
 class RedditTrendsCollector(BaseTrendCollector):
     """Collect trends from Reddit"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending topics from Reddit"""
         try:
             url = "https://www.reddit.com/r/all/hot/.json?limit=25"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'TrendCollector/1.0'
                 }
@@ -95,12 +98,11 @@ class RedditTrendsCollector(BaseTrendCollector):
                     if response.status == 200:
                         data = await response.json()
                         
-                        trends = []
-                        for post in data.get('data', {}).get('children', []):
-                            post_data = post.get('data', {})
-                            title = post_data.get('title', '').strip()
-                            if title:
-                                trends.append(title)
+                        trends = [
+                            title
+                            for post in data.get('data', {}).get('children', [])
+                            if (title := post.get('data', {}).get('title', '').strip())
+                        ]
                         
                         return trends[:20]  # Limit to top 20
         except Exception as e:
@@ -112,26 +114,27 @@ class RedditTrendsCollector(BaseTrendCollector):
 class YahooNewsCollector(BaseTrendCollector):
     """Collect trending news from Yahoo News"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get trending news from Yahoo News"""
         try:
             url = "https://news.yahoo.com/"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
-                        trends = []
                         # Look for article headlines
-                        for element in soup.find_all('h3'):
-                            headline = element.text.strip()
-                            if headline and len(headline) > 10:
-                                trends.append(headline)
+                        trends = [
+                            headline
+                            for element in soup.find_all('h3')
+                            if len(headline := element.get_text(strip=True)) > 10
+                        ]
                         
                         return trends[:15]  # Limit to top 15
         except Exception as e:
@@ -143,26 +146,27 @@ class YahooNewsCollector(BaseTrendCollector):
 class YahooTrendsCollector(BaseTrendCollector):
     """Collect trends from Yahoo Trends"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get US trends from Yahoo"""
         try:
             url = "https://www.yahoo.com/topics/trending-now"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'html.parser')
                         
-                        trends = []
                         # Look for trending topics
-                        for element in soup.find_all(['h2', 'h3', 'h4']):
-                            trend_text = element.text.strip()
-                            if trend_text and len(trend_text) > 5:
-                                trends.append(trend_text)
+                        trends = [
+                            trend_text
+                            for element in soup.find_all(['h2', 'h3', 'h4'])
+                            if len(trend_text := element.get_text(strip=True)) > 5
+                        ]
                         
                         return trends[:15]  # Limit to top 15
         except Exception as e:
@@ -174,22 +178,23 @@ class YahooTrendsCollector(BaseTrendCollector):
 class GoogleNewsCollector(BaseTrendCollector):
     """Collect trending news from Google News"""
     
+    @cache_result()
     async def get_us_trends(self) -> List[str]:
         """Get US trending news from Google News"""
         try:
             url = "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en"
             
-            async with aiohttp.ClientSession() as session:
+            async with shared_session() as session:
                 async with session.get(url, timeout=15) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'xml')
+                        raw = await response.read()
+                        soup = BeautifulSoup(raw, 'xml')
                         
-                        trends = []
-                        for item in soup.find_all('item'):
-                            title = item.find('title')
-                            if title:
-                                trends.append(title.text.strip())
+                        trends = [
+                            title.text.strip()
+                            for item in soup.find_all('item')
+                            if (title := item.find('title'))
+                        ]
                         
                         return trends[:20]  # Limit to top 20
         except Exception as e:
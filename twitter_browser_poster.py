@@ -6,7 +6,7 @@ Handles authentication and posting via Selenium
 import logging
 import time
 import os
-from typing import Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -16,7 +16,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from twitter_poster import TRAILING_COUNT_RE
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +28,19 @@ logger = logging.getLogger(__name__)
 class TwitterBrowserPoster:
     """Handles posting to Twitter using browser automation"""
     
+    # Element locators
+    _USERNAME_SEL = (By.CSS_SELECTOR, 'input[autocomplete="username"]')
+    _EMAIL_SEL = (By.CSS_SELECTOR, 'input[data-testid="ocfEnterTextTextInput"]')
+    _PASSWORD_SEL = (By.CSS_SELECTOR, 'input[name="password"]')
+    _HOME_LINK_SEL = (By.CSS_SELECTOR, '[data-testid="AppTabBar_Home_Link"]')
+    _COMPOSE_BUTTON_SEL = (By.CSS_SELECTOR, 'a[data-testid="SideNav_NewTweet_Button"]')
+    _TWEET_TEXTAREA_SEL = (By.CSS_SELECTOR, 'div[data-testid="tweetTextarea_0"]')
+    _POST_BUTTON_SEL = (By.CSS_SELECTOR, 'button[data-testid="tweetButtonInline"]')
+    
+    # Poll the DOM every 100ms instead of Selenium's default 500ms
+    WAIT_TIMEOUT = 10
+    POLL_FREQUENCY = 0.1
+    
     def __init__(self, username: str = None, password: str = None, email: str = None):
         """
         Initialize Twitter browser poster
@@ -40,6 +54,7 @@ class TwitterBrowserPoster:
         self.password = password or os.getenv('TWITTER_PASSWORD')
         self.email = email or os.getenv('TWITTER_EMAIL')
         self.driver = None
+        self.wait = None
         self.is_logged_in = False
         self.enabled = False
         
@@ -73,6 +88,7 @@ class TwitterBrowserPoster:
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_window_size(1920, 1080)
+            self.wait = WebDriverWait(self.driver, self.WAIT_TIMEOUT, poll_frequency=self.POLL_FREQUENCY)
             
             logger.info("✅ Chrome WebDriver initialized")
             return True
@@ -92,16 +108,14 @@ class TwitterBrowserPoster:
             
             # Enter username
             logger.info("  → Entering username...")
-            username_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[autocomplete="username"]'))
-            )
+            username_input = self.wait.until(EC.presence_of_element_located(self._USERNAME_SEL))
             username_input.send_keys(self.username)
             username_input.send_keys(Keys.RETURN)
             time.sleep(2)
             
             # Check if email verification is needed
             try:
-                email_input = self.driver.find_element(By.CSS_SELECTOR, 'input[data-testid="ocfEnterTextTextInput"]')
+                email_input = self.driver.find_element(*self._EMAIL_SEL)
                 if email_input and self.email:
                     logger.info("  → Email verification required, entering email...")
                     email_input.send_keys(self.email)
@@ -112,18 +126,14 @@ class TwitterBrowserPoster:
             
             # Enter password
             logger.info("  → Entering password...")
-            password_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[name="password"]'))
-            )
+            password_input = self.wait.until(EC.presence_of_element_located(self._PASSWORD_SEL))
             password_input.send_keys(self.password)
             password_input.send_keys(Keys.RETURN)
             time.sleep(5)
             
             # Check if login was successful
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="AppTabBar_Home_Link"]'))
-                )
+                self.wait.until(EC.presence_of_element_located(self._HOME_LINK_SEL))
                 self.is_logged_in = True
                 logger.info("✅ Successfully logged into Twitter!")
                 return True
@@ -140,25 +150,19 @@ class TwitterBrowserPoster:
         try:
             # Click on tweet compose button
             logger.info("  → Opening tweet compose...")
-            compose_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[data-testid="SideNav_NewTweet_Button"]'))
-            )
+            compose_button = self.wait.until(EC.element_to_be_clickable(self._COMPOSE_BUTTON_SEL))
             compose_button.click()
             time.sleep(2)
             
             # Enter tweet text
             logger.info("  → Entering tweet text...")
-            tweet_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-testid="tweetTextarea_0"]'))
-            )
+            tweet_input = self.wait.until(EC.presence_of_element_located(self._TWEET_TEXTAREA_SEL))
             tweet_input.send_keys(tweet_text)
             time.sleep(1)
             
             # Click post button
             logger.info("  → Posting tweet...")
-            post_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-testid="tweetButtonInline"]'))
-            )
+            post_button = self.wait.until(EC.element_to_be_clickable(self._POST_BUTTON_SEL))
             post_button.click()
             time.sleep(3)
             
@@ -190,25 +194,10 @@ class TwitterBrowserPoster:
             return False
         
         try:
-            # Initialize driver if not already done
-            if not self.driver:
-                if not self._init_driver():
-                    return False
-            
-            # Login if not already logged in
-            if not self.is_logged_in:
-                if not self._login():
-                    return False
-            
-            # Format tweet
-            roll_wiki_url = f"https://roll.wiki/summary/{article_id}"
-            
-            # Clean trend name
-            import re
-            clean_trend = re.sub(r'\d+[KkMm]?\s*$', '', trend).strip()
-            clean_trend = clean_trend.lstrip('#')
+            if not self._ensure_session():
+                return False
             
-            tweet_text = f"📰 {clean_trend} - {category}\n🔗 {roll_wiki_url}\n#Wikipedia #Trending"
+            tweet_text = self._format_tweet(trend, category, article_id)
             
             # Post tweet
             logger.info(f"🐦 Posting tweet: {tweet_text[:50]}...")
@@ -218,6 +207,81 @@ class TwitterBrowserPoster:
             logger.error(f"❌ Error in post_tweet: {e}")
             return False
     
+    def post_tweets(self, items: List[Tuple[str, str, Optional[int]]]) -> List[bool]:
+        """
+        Post several tweets in one logged-in browser session
+        
+        Args:
+            items: (trend, category, article_id) tuples
+            
+        Returns:
+            One success flag per item, in order
+        """
+        if not self.enabled:
+            logger.info("Twitter posting is disabled - skipping tweets")
+            return [False] * len(items)
+        
+        try:
+            if not self._ensure_session():
+                return [False] * len(items)
+        except Exception as e:
+            logger.error(f"❌ Error in post_tweets: {e}")
+            return [False] * len(items)
+        
+        results = []
+        for trend, category, article_id in items:
+            if not article_id:
+                logger.warning(f"No article_id for '{trend}' - skipping tweet")
+                results.append(False)
+                continue
+            
+            tweet_text = self._format_tweet(trend, category, article_id)
+            logger.info(f"🐦 Posting tweet: {tweet_text[:50]}...")
+            success = self._post_tweet_internal(tweet_text)
+            results.append(success)
+            
+            # Wait for the posted text to leave the composer before writing the next one
+            # (the inline home-timeline composer itself never leaves the DOM)
+            if success:
+                try:
+                    self.wait.until(self._composer_cleared)
+                except TimeoutException:
+                    logger.warning("  ⚠️ Tweet text still in the composer after posting")
+        
+        logger.info(f"✅ Posted {sum(results)}/{len(items)} tweets")
+        return results
+    
+    def _composer_cleared(self, driver) -> bool:
+        """WebDriverWait condition: the tweet textarea is empty or gone"""
+        try:
+            return not driver.find_element(*self._TWEET_TEXTAREA_SEL).text.strip()
+        except (NoSuchElementException, StaleElementReferenceException):
+            return True
+    
+    def _ensure_session(self) -> bool:
+        """Start the browser and log in unless already done"""
+        # Initialize driver if not already done
+        if not self.driver:
+            if not self._init_driver():
+                return False
+        
+        # Login if not already logged in
+        if not self.is_logged_in:
+            if not self._login():
+                return False
+        
+        return True
+    
+    def _format_tweet(self, trend: str, category: str, article_id: int) -> str:
+        """Format the tweet text for an article"""
+        roll_wiki_url = f"https://roll.wiki/summary/{article_id}"
+        
+        # Clean trend name
+        clean_trend = TRAILING_COUNT_RE.sub('', trend).strip()
+        clean_trend = clean_trend.lstrip('#')
+        
+        return f"📰 {clean_trend} - {category}\n🔗 {roll_wiki_url}\n#Wikipedia #Trending"
+    
     async def post_tweet_async(self, trend: str, category: str, article_id: Optional[int]) -> bool:
         """
         Async wrapper for post_tweet
@@ -3,8 +3,10 @@ Twitter Poster - Automatically posts articles to Twitter
 """
 
 import logging
+import re
 import tweepy
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 import os
 from dotenv import load_dotenv
 
@@ -13,6 +15,39 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Trailing tweet counts like "10K", "176K" on trend names
+TRAILING_COUNT_RE = re.compile(r'\d+[KkMm]?\s*$')
+
+# Category-specific hashtags and keywords for Twitter algorithm
+CATEGORY_HASHTAGS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "Politics": ("#Politics", "#News", "#Breaking", "#WorldNews", "#Government"),
+    "Sports": ("#Sports", "#Game", "#Victory", "#Championship", "#Athletes"),
+    "Entertainment": ("#Entertainment", "#Celebrity", "#Movies", "#TV", "#Shows"),
+    "Music": ("#Music", "#NewMusic", "#Artist", "#Song", "#Concert"),
+    "Technology": ("#Tech", "#Innovation", "#AI", "#Technology", "#Digital"),
+    "Business": ("#Business", "#Economy", "#Finance", "#Markets", "#Investing"),
+    "Science": ("#Science", "#Research", "#Discovery", "#Innovation", "#STEM"),
+    "Medicine": ("#Health", "#Medicine", "#Healthcare", "#Wellness", "#Medical"),
+    "Film": ("#Film", "#Movies", "#Cinema", "#Hollywood", "#BoxOffice"),
+    "Food": ("#Food", "#Foodie", "#Cooking", "#Recipe", "#Delicious"),
+    "Fashion": ("#Fashion", "#Style", "#Trend", "#Designer", "#OOTD"),
+    "Environment": ("#Climate", "#Environment", "#Sustainability", "#GreenEnergy"),
+    "Arts": ("#Art", "#Artist", "#Creative", "#Design", "#Gallery"),
+    "Literature": ("#Books", "#Reading", "#Author", "#Literature", "#BookLovers"),
+    "Education": ("#Education", "#Learning", "#Students", "#Knowledge", "#School"),
+    "Culture": ("#Culture", "#Society", "#History", "#Tradition", "#Heritage"),
+})
+DEFAULT_HASHTAGS = ("#Trending", "#News", "#Viral")
+
+# Engaging tweet variations
+TWEET_TEMPLATES = (
+    "🔥 Trending: {trend}\n📖 Learn more {hashtags}\n🔗 {url}",
+    "📰 What's {trend}?\n✨ Quick summary {hashtags}\n🔗 {url}",
+    "🌟 {trend} explained\n💡 Everything you need to know {hashtags}\n🔗 {url}",
+    "🚀 {trend} is trending!\n📚 Read the full story {hashtags}\n🔗 {url}",
+    "💬 Everyone's talking about {trend}\n📖 Get informed {hashtags}\n🔗 {url}",
+)
+
 
 class TwitterPoster:
     """Handles posting articles to Twitter"""
@@ -89,52 +124,18 @@ class TwitterPoster:
             Formatted tweet text with relevant keywords and hashtags
         """
         # Clean trend name
-        import re
-        clean_trend = re.sub(r'\d+[KkMm]?\s*$', '', trend).strip()
+        clean_trend = TRAILING_COUNT_RE.sub('', trend).strip()
         clean_trend = clean_trend.lstrip('#')
         
-        # Category-specific hashtags and keywords for Twitter algorithm
-        category_hashtags = {
-            "Politics": "#Politics #News #Breaking #WorldNews #Government",
-            "Sports": "#Sports #Game #Victory #Championship #Athletes",
-            "Entertainment": "#Entertainment #Celebrity #Movies #TV #Shows",
-            "Music": "#Music #NewMusic #Artist #Song #Concert",
-            "Technology": "#Tech #Innovation #AI #Technology #Digital",
-            "Business": "#Business #Economy #Finance #Markets #Investing",
-            "Science": "#Science #Research #Discovery #Innovation #STEM",
-            "Medicine": "#Health #Medicine #Healthcare #Wellness #Medical",
-            "Film": "#Film #Movies #Cinema #Hollywood #BoxOffice",
-            "Food": "#Food #Foodie #Cooking #Recipe #Delicious",
-            "Fashion": "#Fashion #Style #Trend #Designer #OOTD",
-            "Environment": "#Climate #Environment #Sustainability #GreenEnergy",
-            "Arts": "#Art #Artist #Creative #Design #Gallery",
-            "Literature": "#Books #Reading #Author #Literature #BookLovers",
-            "Education": "#Education #Learning #Students #Knowledge #School",
-            "Culture": "#Culture #Society #History #Tradition #Heritage"
-        }
-        
-        # Get relevant hashtags for category
-        hashtags = category_hashtags.get(category, "#Trending #News #Viral")
-        # Take first 3 hashtags to keep tweet concise
-        hashtag_list = hashtags.split()[:3]
+        # Take first 3 category hashtags to keep tweet concise
+        hashtag_list = CATEGORY_HASHTAGS.get(category, DEFAULT_HASHTAGS)[:3]
         hashtag_str = " ".join(hashtag_list)
         
-        # Engaging tweet variations
-        templates = [
-            f"🔥 Trending: {clean_trend}\n📖 Learn more {hashtag_str}\n🔗 {roll_wiki_url}",
-            f"📰 What's {clean_trend}?\n✨ Quick summary {hashtag_str}\n🔗 {roll_wiki_url}",
-            f"🌟 {clean_trend} explained\n💡 Everything you need to know {hashtag_str}\n🔗 {roll_wiki_url}",
-            f"🚀 {clean_trend} is trending!\n📚 Read the full story {hashtag_str}\n🔗 {roll_wiki_url}",
-            f"💬 Everyone's talking about {clean_trend}\n📖 Get informed {hashtag_str}\n🔗 {roll_wiki_url}"
-        ]
-        
-        # Choose template based on trend name length
-        import random
-        random.seed(hash(clean_trend))  # Consistent selection for same trend
+        fields = {'trend': clean_trend, 'hashtags': hashtag_str, 'url': roll_wiki_url}
         
         # Try templates until one fits within 280 chars (Twitter limit)
-        for template in templates:
-            tweet = template
+        for template in TWEET_TEMPLATES:
+            tweet = template.format_map(fields)
             if len(tweet) <= 280:
                 return tweet
         
@@ -8,6 +8,13 @@ import logging
 from typing import Set
 from pathlib import Path
 
+# orjson is much faster than stdlib json and writes bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,8 +45,11 @@ class URLTracker:
             data = {
                 'urls': list(self.processed_urls)
             }
-            with open(self.db_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                self.db_file.write_bytes(orjson.dumps(data))
+            else:
+                with open(self.db_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
         except Exception as e:
             logger.error(f"Error saving URL database: {e}")
     
@@ -4,41 +4,312 @@ Video Creator - Pexels video + scrolling text + narration
 """
 
 import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+import importlib.util
+import concurrent.futures
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from typing import Optional
-from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip, AudioFileClip, ImageClip, concatenate_videoclips, CompositeAudioClip
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
-from gtts import gTTS
-import edge_tts
 import asyncio
 import subprocess
 import logging
 import random
+from functools import lru_cache
+from itertools import groupby
+import aiohttp
 from gemini_analyzer import GeminiAnalyzer
+from http_client import get_session
 from exceptions import TTSQuotaExceeded
 
-# Try to import Piper TTS (local, fast, free)
-try:
-    from piper_tts import PiperTTS
-    PIPER_TTS_AVAILABLE = True
-except ImportError:
-    PIPER_TTS_AVAILABLE = False
-    logger.info("⚠️  Piper TTS not available (install with: pip install piper-tts)")
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Try to import markdown for rich text support
-try:
-    import markdown
-    from bs4 import BeautifulSoup
-    MARKDOWN_SUPPORT = True
-except ImportError:
-    MARKDOWN_SUPPORT = False
+# Heavy optional engines (Piper, Bark, MoviePy, gTTS, Edge TTS) are imported where
+# they are used, so startup only pays for the engines a run actually needs.
+# Check whether Piper TTS (local, fast, free) is installed without importing it
+PIPER_TTS_AVAILABLE = importlib.util.find_spec('piper_tts') is not None
+if not PIPER_TTS_AVAILABLE:
+    logger.info("⚠️  Piper TTS not available (install with: pip install piper-tts)")
+
+# Check for markdown support the same way
+MARKDOWN_SUPPORT = all(importlib.util.find_spec(name) is not None for name in ('markdown', 'bs4'))
+if not MARKDOWN_SUPPORT:
     logger.info("⚠️  Markdown support not available (install with: pip install markdown beautifulsoup4)")
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+PEXELS_CACHE_TTL = 24 * 60 * 60  # Pexels search results are reused for a day
+VIDEO_CACHE_MAX_BYTES = 2 << 30  # Downloaded videos kept on disk (least recently used go first)
+TTS_CACHE_SIZE = 128  # Narrations kept on disk
+COPY_AUDIO_CODECS = ('aac',)  # Narration codecs muxed into the MP4 without re-encoding
+
+# Markdown stripping for TTS text
+_RE_BOLD_STARS = re.compile(r'\*\*(.+?)\*\*')
+_RE_BOLD_UNDERSCORES = re.compile(r'__(.+?)__')
+_RE_ITALIC_STAR = re.compile(r'\*(.+?)\*')
+_RE_ITALIC_UNDERSCORE = re.compile(r'_(.+?)_')
+_RE_HEADER = re.compile(r'^#+\s+', re.MULTILINE)
+_RE_LINK = re.compile(r'\[(.+?)\]\(.+?\)')
+_STRIP_MARKDOWN_CHARS = str.maketrans('', '', '*_')
+
+# Markdown styling for the text image: **bold** or *italic*
+_MD_PATTERN = re.compile(r'(\*\*([^\*]+)\*\*|\*([^\*]+)\*)')
+
+
+@lru_cache(maxsize=128)
+def _parse_markdown_segments(text: str) -> tuple:
+    """(text, style) segments of text, memoized since the same text is often re-rendered"""
+    segments = []
+    pos = 0
+    
+    for match in _MD_PATTERN.finditer(text):
+        # Add normal text before match
+        if match.start() > pos:
+            segments.append((text[pos:match.start()], 'normal'))
+        
+        # Add styled text
+        if match.group(2):  # **bold**
+            segments.append((match.group(2), 'bold'))
+        elif match.group(3):  # *italic*
+            segments.append((match.group(3), 'italic'))
+        
+        pos = match.end()
+    
+    # Add remaining normal text
+    if pos < len(text):
+        segments.append((text[pos:], 'normal'))
+    
+    return tuple(segments) if segments else ((text, 'normal'),)
+
+# Parallel Edge TTS: sentence-grouped chunks, capped to stay under Microsoft's throttling
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+TTS_CHUNK_CHARS = 400
+EDGE_TTS_CONCURRENCY = 4
+ASYNC_BATCH_CONCURRENCY = 4  # Videos in flight at once in create_videos_async
+
+# Output frame height per orientation for Gemini TTS videos (width keeps aspect ratio)
+OUTPUT_HEIGHTS = {'portrait': 1280, 'landscape': 720, 'square': 720}
+
+
+def _scaled_size(video_size: tuple, max_height: int) -> tuple:
+    """Frame size scaled down (never up) to max_height, keeping the aspect ratio and even dimensions"""
+    width, height = video_size
+    if height <= max_height:
+        return (width, height)
+    return (int(width * max_height / height) // 2 * 2, max_height)
+
+def _font_size_for_height(video_height: int) -> int:
+    """
+    Scrolling text font size for a video height
+    
+    Formula: font_size = video_height / 30, clamped to 20-60px
+    Examples: 720p → 24px, 1080p → 36px, 1280p → 43px, 1440p → 48px
+    """
+    return max(20, min(60, int(video_height / 30)))
+
+# Frame rate of the precomputed scroll position tables (>= output fps)
+SCROLL_LUT_FPS = 60
+
+
+def _scroll_positions(start_y: float, speed: float, duration: float, fps: int) -> np.ndarray:
+    """Y position of a linearly scrolling clip at every 1/fps step of its duration"""
+    return start_y - speed * np.arange(int(np.ceil(duration * fps)) + 1) / fps
+
+
+# Font candidates in order of preference (macOS, Linux, Windows)
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf",
+)
+BOLD_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+    "C:\\Windows\\Fonts\\arialbd.ttf",
+)
+
+
+@lru_cache(maxsize=2)
+def _find_font(bold: bool = False) -> Optional[str]:
+    """
+    Resolve a usable TrueType font once per process
+    
+    Returns:
+        Font file path or None if none of the candidates exist
+    """
+    for path in (BOLD_FONT_CANDIDATES if bold else FONT_CANDIDATES):
+        if os.path.exists(path):
+            return path
+    logger.warning("⚠️  No known font found, falling back to defaults")
+    return None
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """
+    Load the resolved TrueType font at a size, parsing the font file once per process
+    
+    Raises:
+        Exception if no usable font file was found
+    """
+    path = (_find_font(bold=True) or _find_font()) if bold else _find_font()
+    return ImageFont.truetype(path, font_size)
+
+
+# Word widths outlive a single video: the same common words come up in every text
+@lru_cache(maxsize=4096)
+def _word_advance(word: str, font_size: int, bold: bool = False) -> float:
+    """Advance width of a word in the resolved font (memoized across videos)"""
+    return _load_font(font_size, bold).getlength(word)
+
+
+def _drawtext_font_option() -> str:
+    """drawtext fontfile option for the resolved font (empty = FFmpeg's default font)"""
+    font_path = _find_font()
+    if not font_path:
+        return ""
+    # Escape for the filtergraph: forward slashes and a quoted, escaped drive colon
+    escaped = font_path.replace('\\', '/').translate(DRAWTEXT_ESCAPE)
+    return f":fontfile='{escaped}'"
+
+
+@lru_cache(maxsize=16)
+def _average_advance(font_size: int) -> float:
+    """
+    Average glyph advance for wrapping when none of FONT_CANDIDATES exists
+    
+    Measured on Pillow's built-in scalable font (Pillow >= 10.1), which is much
+    closer to real text than a flat 0.6em per character.
+    """
+    sample = "abcdefghijklmnopqrstuvwxyz "
+    try:
+        return ImageFont.load_default(size=font_size).getlength(sample) / len(sample)
+    except Exception:
+        return font_size * 0.6
+
+
+# The scroll speed calculation and the drawtext fallback wrap the same text
+@lru_cache(maxsize=16)
+def _wrap_lines(text: str, max_text_width: int, font_size: int) -> tuple:
+    """Wrapped lines of text for VideoCreator._wrap_text (memoized)"""
+    try:
+        _load_font(font_size)
+        measure = lambda word: _word_advance(word, font_size)
+    except Exception:
+        # No known TrueType font - estimate with an average glyph advance
+        advance = _average_advance(font_size)
+        measure = lambda word: len(word) * advance
+    
+    words = text.split()
+    if not words:
+        return ()
+    
+    # Measure each distinct word once, then find line breaks on the cumulative
+    # advance widths: cum[j] - cum[i] - space is the width of words[i:j]
+    space = measure(' ')
+    word_widths = {}
+    advances = np.fromiter(
+        ((word_widths.get(w) or word_widths.setdefault(w, measure(w))) + space for w in words),
+        dtype=np.float64, count=len(words)
+    )
+    cum = np.concatenate(([0.0], np.cumsum(advances)))
+    
+    lines = []
+    start = 0
+    while start < len(words):
+        end = int(np.searchsorted(cum, cum[start] + max_text_width + space, side='right')) - 1
+        # A single over-long word still gets its own line
+        end = max(end, start + 1)
+        lines.append(' '.join(words[start:end]))
+        start = end
+    
+    return tuple(lines)
+
+
+# Escapes for quoted drawtext option values, applied in one pass
+DRAWTEXT_ESCAPE = str.maketrans({"'": "'\\''", ":": "\\:"})
+
+HEADER_TEXT = "by roll.wiki . video from pexels, article from wikipedia."
+
+
+# libx264 presets, fastest first. Each step slower buys a few % smaller files at the
+# same CRF; for short, noisy B-roll 'veryfast'/'faster' are the knee of that curve.
+X264_PRESETS = ('ultrafast', 'superfast', 'veryfast', 'faster', 'fast',
+                'medium', 'slow', 'slower', 'veryslow')
+
+# Hardware H.264 encoders in order of preference (NVIDIA, Apple, Intel)
+HW_ENCODERS = ('h264_nvenc', 'h264_videotoolbox', 'h264_qsv')
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """
+    Find a working hardware H.264 encoder (checked once per process)
+    
+    An encoder being listed by `ffmpeg -encoders` only means it was compiled in,
+    so each candidate is verified with a tiny test encode.
+    
+    Returns:
+        Encoder name or None if only software encoding is available
+    """
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10)
+    except Exception:
+        return None
+    
+    for encoder in HW_ENCODERS:
+        if encoder not in result.stdout:
+            continue
+        test_cmd = [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=black:s=256x256:d=0.1',
+            '-c:v', encoder, '-f', 'null', '-'
+        ]
+        try:
+            if subprocess.run(test_cmd, capture_output=True, timeout=15).returncode == 0:
+                logger.info(f"⚡ Using hardware encoder: {encoder}")
+                return encoder
+        except Exception:
+            continue
+    return None
+
+
+# Lines of FFmpeg's stderr kept for the error log
+FFMPEG_ERROR_LINES = 20
+
+
+def _run_ffmpeg(cmd: list, input_data: Optional[bytes] = None,
+                timeout: Optional[float] = None) -> Optional[str]:
+    """
+    Run an FFmpeg command, discarding stdout
+    
+    Args:
+        cmd: Full command (should include -loglevel error so stderr stays small)
+        input_data: Bytes written to FFmpeg's stdin
+        timeout: Seconds before subprocess.TimeoutExpired is raised
+        
+    Returns:
+        None on success, else the tail of FFmpeg's error output
+    """
+    result = subprocess.run(cmd, input=input_data, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, timeout=timeout)
+    if result.returncode == 0:
+        return None
+    tail = deque(result.stderr.decode(errors='replace').splitlines(), maxlen=FFMPEG_ERROR_LINES)
+    return '\n'.join(tail) or f"exit code {result.returncode}"
+
 
 class VideoCreator:
     """Creates videos with scrolling text and narration"""
@@ -64,12 +335,27 @@ class VideoCreator:
             config: Configuration dictionary from dashboard
         """
         self.pexels_api_key = pexels_api_key or os.getenv('PEXELS_API_KEY')
+        
+        # Keep-alive session so Pexels searches and downloads reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.output_dir = Path('output_videos')
         self.output_dir.mkdir(exist_ok=True)
         
         self.temp_dir = Path('temp_videos')
         self.temp_dir.mkdir(exist_ok=True)
         
+        # Disk cache for Pexels search results and downloaded videos
+        self.cache_dir = Path('cache_videos')
+        self.cache_dir.mkdir(exist_ok=True)
+        
+        # Narration cache, shared by create_batch workers (least recently used entries,
+        # by file mtime, are evicted past TTS_CACHE_SIZE)
+        self._tts_cache_dir = self.temp_dir / 'tts_cache'
+        self._tts_cache_dir.mkdir(exist_ok=True)
+        
         # Load video settings from config
         self.config = config or {}
         video_settings = self.config.get('video_settings', {})
@@ -80,6 +366,18 @@ class VideoCreator:
         self.scroll_speed = video_settings.get('scroll_speed', 50)
         self.video_volume = video_settings.get('video_volume', 0.1)
         self.force_english_tts = video_settings.get('force_english_tts', True)
+        # x264 speed/quality trade-off ('veryfast' is ~3x faster than 'medium' at similar quality)
+        self.x264_preset = video_settings.get('x264_preset', 'veryfast')
+        if self.x264_preset not in X264_PRESETS:
+            # A typo here would make every FFmpeg render fail
+            logger.warning(f"⚠️  Unknown x264_preset '{self.x264_preset}', using 'veryfast'")
+            self.x264_preset = 'veryfast'
+        self.use_hw_encoder = video_settings.get('use_hw_encoder', True)
+        # libx264 threads per encode (0 = one per core; create_batch splits the cores)
+        self.encoder_threads = int(video_settings.get('encoder_threads', 0))
+        # Let FFmpeg read uncached Pexels videos over HTTP instead of downloading them
+        # first (saves a disk round trip, but looped clips are re-fetched per loop)
+        self.stream_pexels_video = video_settings.get('stream_pexels_video', False)
         
         # Initialize TTS engines (priority: Gemini > Edge > Bark > Piper > gTTS)
         self.use_edge_tts = use_edge_tts
@@ -90,6 +388,25 @@ class VideoCreator:
         self.gemini_analyzer = None
         self.bark_model = None
         
+        # Last rendered text image as ((text, width, font_size, use_markdown, stroke_width,
+        # padding), PIL image)
+        self._text_image = None
+        
+        # Optionally warm Bark up in the background so a fallback to it doesn't
+        # pay the model load on the critical path (costs memory on every run)
+        self._bark_preload = None
+        if (use_bark_tts and video_settings.get('preload_bark_tts', False)
+                and importlib.util.find_spec('bark') is not None):
+            self._bark_preload = threading.Thread(target=self._preload_bark, daemon=True)
+            self._bark_preload.start()
+        
+        # One persistent event loop, running on a daemon thread, for async TTS/Gemini
+        # calls made from sync code (works whether or not the caller runs a loop)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        # Async pipelines render in worker threads, one FFmpeg encode at a time
+        self._render_lock = threading.Lock()
+        
         # Always initialize Gemini for video search keywords (even if not using for TTS)
         if use_gemini_tts or use_edge_tts:
             self.gemini_analyzer = GeminiAnalyzer()
@@ -123,6 +440,24 @@ class VideoCreator:
             logger.info(f"Using gTTS (basic quality)")
             logger.info(f"   English: {self.force_english_tts}")
     
+    def _run_async(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine to completion from synchronous code
+        
+        The coroutine is scheduled on this instance's background event loop, so no
+        loop or thread pool is created per call.
+        
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling it (None = no limit)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
     def search_pexels_video(self, query: str, orientation: str = "portrait", 
                            size: str = "medium") -> Optional[dict]:
         """
@@ -150,37 +485,41 @@ class VideoCreator:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get('videos') and len(data['videos']) > 0:
-                # Randomly select a video from the results
-                video = random.choice(data['videos'])
-                logger.info(f"🎲 Randomly selected video (from {len(data['videos'])} results): {video.get('url')}")
-                
-                # Get HD video file
-                video_files = video.get('video_files', [])
-                for vf in video_files:
-                    if vf.get('quality') == 'hd':
-                        return {
-                            'url': vf.get('link'),
-                            'width': vf.get('width'),
-                            'height': vf.get('height'),
-                            'duration': video.get('duration'),
-                            'id': video.get('id')
-                        }
-                
-                # Fallback to first video file
-                if video_files:
-                    vf = video_files[0]
-                    return {
-                        'url': vf.get('link'),
-                        'width': vf.get('width'),
-                        'height': vf.get('height'),
-                        'duration': video.get('duration'),
-                        'id': video.get('id')
-                    }
+            # Reuse a recent response for the same search (random pick still varies)
+            cache_key = hashlib.sha256(f"{query}|{orientation}|{size}".encode()).hexdigest()
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            if cache_file.exists() and time.time() - cache_file.stat().st_mtime < PEXELS_CACHE_TTL:
+                data = json.loads(cache_file.read_bytes())
+                logger.info(f"📦 Using cached Pexels results for: {query}")
+            else:
+                # API key only goes to the API host, not to the video CDN
+                response = self.session.get(url, headers=headers, params=params, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                if data.get('videos'):
+                    cache_file.write_text(json.dumps(data), encoding='utf-8')
+            
+            # Pair every result with its HD file (or first file) in one pass, then
+            # pick randomly among videos that actually have a file
+            candidates = [
+                (video, vf)
+                for video in data.get('videos', [])
+                if (vf := next(
+                    (f for f in video.get('video_files', []) if f.get('quality') == 'hd'),
+                    next(iter(video.get('video_files', [])), None)
+                ))
+            ]
+            
+            if candidates:
+                video, vf = random.choice(candidates)
+                logger.info(f"🎲 Randomly selected video (from {len(candidates)} results): {video.get('url')}")
+                return {
+                    'url': vf.get('link'),
+                    'width': vf.get('width'),
+                    'height': vf.get('height'),
+                    'duration': video.get('duration'),
+                    'id': video.get('id')
+                }
             
             logger.warning(f"No videos found for query: {query}")
             return None
@@ -192,14 +531,59 @@ class VideoCreator:
     def download_video(self, video_url: str, output_path: Path) -> bool:
         """Download video from URL"""
         try:
-            logger.info(f"Downloading video from {video_url}")
-            response = requests.get(video_url, stream=True)
-            response.raise_for_status()
+            cached_path = self._video_cache_path(video_url)
+            if not cached_path.exists():
+                logger.info(f"Downloading video from {video_url}")
+                partial_fd, partial_path = self._partial_download_file()
+                try:
+                    with os.fdopen(partial_fd, 'wb') as f, \
+                            self.session.get(video_url, stream=True, timeout=60) as response:
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        
+                        # Copy in 1 MiB blocks inside C instead of thousands of 8 KiB Python iterations
+                        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    os.replace(partial_path, cached_path)
+                except BaseException:
+                    partial_path.unlink(missing_ok=True)
+                    raise
+                self._evict_video_cache(keep=cached_path)
+            else:
+                logger.info(f"📦 Using cached video: {cached_path}")
+                os.utime(cached_path)  # Mark as recently used for eviction
             
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self._place_cached_video(cached_path, output_path)
+            logger.info(f"Video downloaded: {output_path}")
+            return True
             
+        except Exception as e:
+            logger.error(f"Error downloading video: {e}")
+            return False
+    
+    async def download_video_async(self, video_url: str, output_path: Path) -> bool:
+        """Download video from URL without blocking the event loop (shares the video cache)"""
+        try:
+            cached_path = self._video_cache_path(video_url)
+            if not cached_path.exists():
+                logger.info(f"Downloading video from {video_url}")
+                partial_fd, partial_path = self._partial_download_file()
+                try:
+                    session = get_session()
+                    with os.fdopen(partial_fd, 'wb') as f:
+                        async with session.get(video_url, timeout=aiohttp.ClientTimeout(total=300)) as response:
+                            response.raise_for_status()
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                    os.replace(partial_path, cached_path)
+                except BaseException:
+                    partial_path.unlink(missing_ok=True)
+                    raise
+                self._evict_video_cache(keep=cached_path)
+            else:
+                logger.info(f"📦 Using cached video: {cached_path}")
+                os.utime(cached_path)  # Mark as recently used for eviction
+            
+            self._place_cached_video(cached_path, output_path)
             logger.info(f"Video downloaded: {output_path}")
             return True
             
@@ -207,9 +591,67 @@ class VideoCreator:
             logger.error(f"Error downloading video: {e}")
             return False
     
+    def _partial_download_file(self) -> tuple:
+        """
+        Open a uniquely named partial file in the video cache
+        
+        Every download gets its own file, so batch worker processes and concurrent
+        coroutines fetching the same URL never write to one file; the finished
+        download is renamed over the cache entry.
+        
+        Returns:
+            (file descriptor, path) of the new partial file
+        """
+        fd, path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+        return fd, Path(path)
+    
+    def _video_cache_path(self, video_url: str) -> Path:
+        """Location of a downloaded video in the disk cache"""
+        return self.cache_dir / f"{hashlib.sha256(video_url.encode()).hexdigest()}.mp4"
+    
+    def _evict_video_cache(self, keep: Path):
+        """
+        Delete the least recently used cached videos past VIDEO_CACHE_MAX_BYTES,
+        and Pexels search results older than PEXELS_CACHE_TTL
+        
+        Args:
+            keep: Video that was just cached (never evicted)
+        """
+        try:
+            now = time.time()
+            for search_file in self.cache_dir.glob('*.json'):
+                if now - search_file.stat().st_mtime >= PEXELS_CACHE_TTL:
+                    search_file.unlink(missing_ok=True)
+            
+            videos = sorted(
+                ((path.stat(), path) for path in self.cache_dir.glob('*.mp4')),
+                key=lambda item: item[0].st_mtime
+            )
+            total = sum(st.st_size for st, _ in videos)
+            for st, path in videos:
+                if total <= VIDEO_CACHE_MAX_BYTES:
+                    break
+                if path == keep:
+                    continue
+                # Hard links placed in temp_videos keep their own copy alive
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+        except OSError as e:
+            logger.warning(f"Could not evict cached videos: {e}")
+    
+    def _place_cached_video(self, cached_path: Path, output_path: Path):
+        """Hard-link a cached video into place (callers delete their copy when done); copy across filesystems"""
+        Path(output_path).unlink(missing_ok=True)
+        try:
+            os.link(cached_path, output_path)
+        except OSError:
+            shutil.copyfile(cached_path, output_path)
+    
     async def create_narration_edge(self, text: str, output_path: Path, voice: str = 'en-US-AriaNeural', rate: str = '+20%') -> bool:
         """
         Create high-quality narration using Edge TTS (Microsoft, free)
+        Long texts are split at sentence boundaries and synthesized in parallel
+        (at most EDGE_TTS_CONCURRENCY requests at once), then joined losslessly.
         
         Args:
             text: Text to convert to speech
@@ -222,8 +664,44 @@ class VideoCreator:
             logger.info(f"Creating high-quality narration with Edge TTS ({voice}, rate={rate})...")
             logger.info(f"Text preview: {text[:80]}...")
             
-            communicate = edge_tts.Communicate(text, voice, rate=rate)
-            await communicate.save(str(output_path))
+            chunks = self._split_tts_chunks(text)
+            if len(chunks) == 1:
+                if not await self._edge_tts_to_file(text, Path(output_path), voice, rate):
+                    return False
+            else:
+                logger.info(f"   Synthesizing {len(chunks)} chunks in parallel...")
+                part_dir = Path(tempfile.mkdtemp(dir=self.temp_dir))
+                try:
+                    semaphore = asyncio.Semaphore(EDGE_TTS_CONCURRENCY)
+                    part_paths = [part_dir / f"{i:03d}.mp3" for i in range(len(chunks))]
+                    
+                    async def synthesize(chunk: str, path: Path) -> bool:
+                        async with semaphore:
+                            return await self._edge_tts_to_file(chunk, path, voice, rate)
+                    
+                    results = await asyncio.gather(*(synthesize(c, p) for c, p in zip(chunks, part_paths)))
+                    if not all(results):
+                        return False
+                    
+                    # Join the parts with the concat demuxer (stream copy, no re-encode)
+                    concat_list = part_dir / 'concat.txt'
+                    concat_list.write_text(
+                        ''.join(f"file '{path.resolve().as_posix()}'\n" for path in part_paths),
+                        encoding='utf-8'
+                    )
+                    process = await asyncio.create_subprocess_exec(
+                        'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                        '-f', 'concat', '-safe', '0', '-i', str(concat_list),
+                        '-c', 'copy', str(output_path),
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    _, stderr = await process.communicate()
+                    if process.returncode != 0:
+                        logger.error(f"FFmpeg concat error: {stderr.decode(errors='replace')}")
+                        return False
+                finally:
+                    shutil.rmtree(part_dir, ignore_errors=True)
             
             logger.info(f"✅ High-quality narration saved: {output_path}")
             return True
@@ -233,6 +711,43 @@ class VideoCreator:
             logger.warning("⚠️  Edge TTS failed, will retry after waiting...")
             return False
     
+    async def _edge_tts_to_file(self, text: str, output_path: Path, voice: str, rate: str) -> bool:
+        """Synthesize one Edge TTS request, streaming audio to disk and publishing only a complete file"""
+        import edge_tts
+        
+        communicate = edge_tts.Communicate(text, voice, rate=rate)
+        partial_path = output_path.with_suffix('.part')
+        audio_bytes = 0
+        with open(partial_path, 'wb') as f:
+            async for chunk in communicate.stream():
+                if chunk['type'] == 'audio':
+                    f.write(chunk['data'])
+                    audio_bytes += len(chunk['data'])
+        
+        if not audio_bytes:
+            partial_path.unlink(missing_ok=True)
+            logger.error("Edge TTS returned no audio")
+            return False
+        os.replace(partial_path, output_path)
+        return True
+    
+    def _split_tts_chunks(self, text: str) -> list:
+        """
+        Split text at sentence boundaries into chunks of roughly TTS_CHUNK_CHARS
+        (whole sentences are grouped so short sentences don't each cost a request)
+        """
+        chunks = []
+        current = ''
+        for sentence in SENTENCE_SPLIT_RE.split(text.strip()):
+            if current and len(current) + len(sentence) > TTS_CHUNK_CHARS:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+        return chunks or [text]
+    
     def create_narration_gtts(self, text: str, output_path: Path, lang: str = 'en') -> bool:
         """
         Fallback: Create narration using gTTS (lower quality but reliable)
@@ -243,6 +758,8 @@ class VideoCreator:
             lang: Language code ('en', 'tr', etc.)
         """
         try:
+            from gtts import gTTS
+            
             logger.info(f"Creating narration with gTTS for: {text[:50]}...")
             tts = gTTS(text=text, lang=lang, slow=False)
             tts.save(str(output_path))
@@ -253,26 +770,26 @@ class VideoCreator:
             logger.error(f"Error creating narration: {e}")
             return False
     
-    def create_narration_bark(self, text: str, output_path: Path) -> bool:
+    def create_narration_bark(self, text: str, output_path: Path, tempo: float = 1.0) -> bool:
         """
         Create narration using Bark TTS from Suno AI (high quality local fallback)
+        The generated samples are piped straight into FFmpeg, which applies the
+        tempo change and encodes to the output format in one pass.
         
         Args:
             text: Text to convert to speech
-            output_path: Output audio file path
+            output_path: Output audio file path (format from its extension)
+            tempo: Playback speed factor (e.g. 1.2 = 20% faster)
         """
         try:
             logger.info(f"Creating narration with Bark TTS (Suno AI)...")
             logger.info(f"Text preview: {text[:80]}...")
             
-            # Lazy load Bark (only when needed)
+            # Wait for a background preload, else lazy load Bark (only when needed)
+            if self._bark_preload is not None:
+                self._bark_preload.join()
             if self.bark_model is None:
-                logger.info("Loading Bark TTS model from Suno AI...")
-                from bark import SAMPLE_RATE, generate_audio, preload_models
-                # Download and load all models (first time only)
-                preload_models()
-                self.bark_model = True  # Mark as loaded
-                logger.info("✅ Bark TTS model loaded")
+                self._load_bark()
             
             from bark import SAMPLE_RATE, generate_audio
             
@@ -280,9 +797,19 @@ class VideoCreator:
             # Use 'v2/en_speaker_6' for male narrator voice
             audio_array = generate_audio(text, history_prompt="v2/en_speaker_6")
             
-            # Save audio
-            from scipy.io.wavfile import write as write_wav
-            write_wav(str(output_path), SAMPLE_RATE, audio_array)
+            # Encode 16-bit PCM from stdin (no intermediate WAV file)
+            pcm = (np.clip(audio_array, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+            cmd = [
+                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1',
+                '-i', 'pipe:0',
+                *(['-filter:a', f'atempo={tempo}'] if tempo != 1.0 else []),
+                str(output_path)
+            ]
+            result = subprocess.run(cmd, input=pcm, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                logger.error(f"FFmpeg error encoding Bark audio: {result.stderr.decode(errors='replace')}")
+                return False
             
             logger.info(f"✅ Bark TTS narration saved: {output_path}")
             return True
@@ -294,6 +821,21 @@ class VideoCreator:
             traceback.print_exc()
             return False
     
+    def _load_bark(self):
+        """Download (first time only) and load all Bark models"""
+        logger.info("Loading Bark TTS model from Suno AI...")
+        from bark import preload_models
+        preload_models()
+        self.bark_model = True  # Mark as loaded
+        logger.info("✅ Bark TTS model loaded")
+    
+    def _preload_bark(self):
+        """Background thread target for loading Bark ahead of time"""
+        try:
+            self._load_bark()
+        except Exception as e:
+            logger.warning(f"⚠️  Bark TTS preload failed: {e}")
+    
     def _clean_text_for_tts(self, text: str) -> str:
         """
         Clean text for TTS by removing markdown, asterisks, and special formatting
@@ -304,24 +846,22 @@ class VideoCreator:
         Returns:
             Cleaned text suitable for TTS
         """
-        import re
-        
         # Remove markdown bold (**text** or __text__)
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-        text = re.sub(r'__(.+?)__', r'\1', text)
+        text = _RE_BOLD_STARS.sub(r'\1', text)
+        text = _RE_BOLD_UNDERSCORES.sub(r'\1', text)
         
         # Remove markdown italic (*text* or _text_)
-        text = re.sub(r'\*(.+?)\*', r'\1', text)
-        text = re.sub(r'_(.+?)_', r'\1', text)
+        text = _RE_ITALIC_STAR.sub(r'\1', text)
+        text = _RE_ITALIC_UNDERSCORE.sub(r'\1', text)
         
         # Remove markdown headers (# ## ###)
-        text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)
+        text = _RE_HEADER.sub('', text)
         
         # Remove markdown links [text](url)
-        text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)
+        text = _RE_LINK.sub(r'\1', text)
         
-        # Remove remaining single asterisks/underscores
-        text = text.replace('*', '').replace('_', '')
+        # Remove remaining single asterisks/underscores (one C pass)
+        text = text.translate(_STRIP_MARKDOWN_CHARS)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
@@ -329,6 +869,20 @@ class VideoCreator:
         logger.debug(f"Cleaned text for TTS: {text[:100]}...")
         return text
     
+    def _wrap_text(self, text: str, max_text_width: int, font_size: int) -> list:
+        """
+        Greedy word wrap that packs as many words per line as the real font fits
+        
+        Args:
+            text: Text to wrap
+            max_text_width: Maximum line width in pixels
+            font_size: Font size in pixels
+            
+        Returns:
+            List of wrapped lines
+        """
+        return list(_wrap_lines(text, max_text_width, font_size))
+    
     def _calculate_optimal_scroll_speed(self, text: str, video_width: int, video_height: int, 
                                        narration_duration: float = None, 
                                        font_size: int = 24) -> tuple[float, float]:
@@ -346,42 +900,11 @@ class VideoCreator:
         Returns:
             Tuple of (scroll_speed in px/s, target_duration in seconds)
         """
-        # Use EXACT same calculation as FFmpeg (lines 608-645)
+        # Use EXACT same wrapping as the drawtext fallback
         padding = 30  # 15px each side - minimal safe margin
         max_text_width = video_width - (padding * 2)
-        chars_per_line = int(max_text_width / (font_size * 0.6))
-        
-        # Wrap text exactly like FFmpeg does
         words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
-            
-            # If word is too long for a line, put it on its own line anyway
-            if word_length > chars_per_line:
-                # Flush current line first if it has content
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = []
-                    current_length = 0
-                # Add long word on its own line
-                lines.append(word)
-            elif current_length + word_length > chars_per_line and current_line:
-                # Current line is full, start new line
-                lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = word_length
-            else:
-                # Add word to current line
-                current_line.append(word)
-                current_length += word_length
-        
-        # Don't forget the last line
-        if current_line:
-            lines.append(' '.join(current_line))
+        lines = self._wrap_text(text, max_text_width, font_size)
         
         # No arbitrary line limit - show all text
         # lines = lines[:80]  # REMOVED: This was causing text truncation
@@ -427,10 +950,13 @@ class VideoCreator:
     def create_scrolling_text_clip(self, text: str, video_size: tuple, 
                                    duration: float, font_size: int = 28,
                                    color: str = 'white', bg_color: str = 'black',
-                                   scroll_speed: float = 50) -> TextClip:
+                                   scroll_speed: float = 50) -> 'VideoClip':
         """
         Create a scrolling text clip
         
+        The text is rasterized once into an RGBA bitmap; every frame is then just a
+        slice of that array, so no glyphs are drawn while the video renders.
+        
         Args:
             text: Text to display
             video_size: (width, height) of the video
@@ -440,39 +966,67 @@ class VideoCreator:
             bg_color: Background color
             scroll_speed: Scrolling speed (pixels per second)
         """
+        # MoviePy is optional: only this helper needs it, the FFmpeg pipeline doesn't
+        try:
+            from moviepy.editor import VideoClip
+        except ImportError as e:
+            raise ImportError("create_scrolling_text_clip needs MoviePy (pip install moviepy==1.0.3)") from e
+        
         width, height = video_size
+        max_box_width = width - 100  # Leave margins
+        padding = 10
+        line_height = int(font_size * 1.2)
         
-        # Create text clip with semi-transparent black background
-        txt_clip = TextClip(
-            text=text,
-            font_size=font_size,
-            color=color,
-            bg_color=bg_color,
-            method='caption',
-            size=(width - 100, None),  # Leave margins
-            font='Arial'
-        )
+        try:
+            font = _load_font(font_size)
+        except Exception:
+            font = ImageFont.load_default()
+        lines = self._wrap_text(text, max_box_width - padding * 2, font_size)
         
-        # Calculate scrolling (don't use opacity to avoid mask issues)
-        text_height = txt_clip.h
-        start_y = height  # Start below screen
-        end_y = -text_height  # End above screen
+        # Only as wide as the longest line: the clip is centered, and a narrower
+        # bitmap means less to slice and composite on every frame
+        widest = max((font.getlength(line) for line in lines), default=0)
+        box_width = min(max_box_width, int(widest) + 1 + padding * 2)
+        
+        # Render the whole text block once on the background color
+        text_height = len(lines) * line_height + padding * 2
+        image = Image.new('RGBA', (box_width, text_height), bg_color)
+        draw = ImageDraw.Draw(image)
+        for i, line in enumerate(lines):
+            draw.text((padding, padding + i * line_height), line, font=font, fill=color,
+                      stroke_width=2, stroke_fill='black')
         
-        # Create position function for scrolling
-        def make_frame_func(t):
-            # Linear scrolling
-            y_position = start_y - (scroll_speed * t)
-            return txt_clip.get_frame(t)
+        # Transparent rows above and below the text let every frame be a plain slice
+        bitmap = np.zeros((text_height + 2 * height, box_width, 4), dtype=np.uint8)
+        bitmap[height:height + text_height] = np.asarray(image)
+        rgb = bitmap[:, :, :3]
+        alpha = bitmap[:, :, 3].astype(np.float32) / 255.0
         
-        def position_func(t):
-            y = start_y - (scroll_speed * t)
-            # Keep position within reasonable bounds to avoid mask issues
+        # Precompute the y position of every frame once; frames then only index it
+        start_y = height  # Start below screen
+        positions = _scroll_positions(start_y, scroll_speed, duration, SCROLL_LUT_FPS)
+        last_row = text_height + height
+        
+        def first_row(t):
+            y = positions[min(int(t * SCROLL_LUT_FPS), len(positions) - 1)]
             # Allow scrolling from bottom to top completely
-            return ('center', y)
+            return min(max(int(height - y), 0), last_row)
+        
+        def make_frame(t):
+            row = first_row(t)
+            return rgb[row:row + height]
         
-        # Set position and duration (MoviePy 2.x API)
-        txt_clip = txt_clip.with_position(position_func)
-        txt_clip = txt_clip.with_duration(duration)
+        def make_mask(t):
+            row = first_row(t)
+            return alpha[row:row + height]
+        
+        txt_clip = VideoClip(make_frame, duration=duration)
+        mask = VideoClip(make_mask, ismask=True, duration=duration)
+        
+        # Set mask, position and duration (MoviePy 1.x API, as pinned in requirements.txt)
+        txt_clip = txt_clip.set_mask(mask)
+        txt_clip = txt_clip.set_position(('center', 0))
+        txt_clip = txt_clip.set_duration(duration)
         
         return txt_clip
     
@@ -485,13 +1039,15 @@ class VideoCreator:
         scroll_speed: float = 50,
         font_size: int = 28,
         video_volume: float = 0.1,
-        use_markdown: bool = False
+        use_markdown: bool = False,
+        narration_path: Optional[Path] = None,
+        output_height: Optional[int] = None
     ) -> bool:
         """
         Create final video with scrolling text and narration
         
         Args:
-            video_path: Input video file path
+            video_path: Input video file path (or an http(s) URL FFmpeg can stream)
             text: Text to display and narrate
             output_path: Output video file path
             narration_lang: Language for narration ('en', 'tr', etc.)
@@ -499,276 +1055,104 @@ class VideoCreator:
             font_size: Text font size
             video_volume: Original video volume (0.0-1.0, default 0.1 for low)
             use_markdown: Enable markdown formatting in text
+            narration_path: Pre-made narration audio (created here if None)
+            output_height: Scale the video down to this height while decoding (None keeps its size)
         """
         try:
             logger.info("Creating video with text and narration...")
             
-            # Load video
-            video = VideoFileClip(str(video_path))
-            video_duration = video.duration
-            video_size = video.size
-            video_height = video_size[1]
-            
-            # Calculate optimal font size based on video resolution
-            # Formula: font_size = video_height / 30
-            # Examples: 720p → 24px, 1080p → 36px, 1280p → 43px, 1440p → 48px
-            calculated_font_size = max(20, min(60, int(video_height / 30)))
+            # Read video metadata from the container headers (no decoding)
+            video_info = self._probe_media(video_path)
+            if not video_info or not video_info['height']:
+                logger.error(f"Could not read video metadata: {video_path}")
+                return False
+            video_duration = video_info['duration']
+            video_size = (video_info['width'], video_info['height'])
+            # Text is laid out for the output frame; FFmpeg's scale filter does the resize
+            frame_size = _scaled_size(video_size, output_height) if output_height else video_size
+            video_height = frame_size[1]
             
-            # Override font_size parameter with calculated value
-            font_size = calculated_font_size
+            # Override font_size parameter with one based on video resolution
+            font_size = _font_size_for_height(video_height)
             
             logger.info(f"Video loaded: {video_duration}s, {video_size}")
+            if frame_size != video_size:
+                logger.info(f"   Output size: {frame_size[0]}x{frame_size[1]}")
             logger.info(f"📏 Calculated font size: {font_size}px (based on {video_height}px height)")
             
-            # Handle video audio based on volume setting
-            if video.audio:
-                if video_volume == 0.0:
-                    # Completely mute video - remove audio track for efficiency
-                    video = video.without_audio()
-                    logger.info(f"🔇 Video audio muted (removed)")
-                else:
-                    # Lower video audio volume
-                    # MoviePy 2.x: multiply audio frames by volume factor
-                    def volume_modifier(get_frame, t):
-                        return get_frame(t) * video_volume
-                    
-                    lowered_audio = video.audio.transform(volume_modifier)
-                    video = video.set_audio(lowered_audio)
+            # Original video audio is mixed in by FFmpeg at video_volume (0.0 = muted/dropped)
+            keep_video_audio = video_info['has_audio'] and video_volume > 0.0
+            if video_info['has_audio']:
+                if keep_video_audio:
                     logger.info(f"🔉 Video audio volume set to {video_volume}")
+                else:
+                    logger.info(f"🔇 Video audio muted (removed)")
             
-            # Create narration (priority: Gemini Flash > Edge > Retry after 5 min)
-            # Use .mp3 for Edge/Gemini TTS, .wav for Piper TTS
-            narration_path = self.temp_dir / "narration.mp3"
-            success = False
-            max_retries = 3
-            retry_count = 0
-            
-            # Clean text for TTS (remove markdown, asterisks, etc.)
-            tts_text = self._clean_text_for_tts(text)
-            
-            while not success and retry_count < max_retries:
-                if retry_count > 0:
-                    logger.warning(f"⏳ TTS failed, waiting 5 minutes before retry {retry_count}/{max_retries}...")
-                    import time
-                    time.sleep(300)  # Wait 5 minutes
-                    logger.info(f"🔄 Retrying TTS (attempt {retry_count + 1}/{max_retries})...")
-                
-                # 1. Try Gemini TTS first (highest priority)
-                if self.use_gemini_tts and self.gemini_analyzer:
-                    try:
-                        logger.info("Creating narration with Gemini Flash TTS (primary)...")
-                        # Run async Gemini TTS - ALWAYS English
-                        import asyncio
-                        import concurrent.futures
-                        
-                        # Check if event loop is running
-                        try:
-                            loop = asyncio.get_running_loop()
-                            # If we're in an event loop, use run_in_executor
-                            with concurrent.futures.ThreadPoolExecutor() as executor:
-                                success = executor.submit(
-                                    lambda: asyncio.run(self.gemini_analyzer.text_to_speech(
-                                        text=tts_text,
-                                        output_path=str(narration_path),
-                                        language_code="en-US",
-                                        speaking_rate=1.2  # %20 faster for <60s videos
-                                    ))
-                                ).result()
-                        except RuntimeError:
-                            # No event loop running, safe to use asyncio.run
-                            success = asyncio.run(self.gemini_analyzer.text_to_speech(
-                                text=tts_text,
-                                output_path=str(narration_path),
-                                language_code="en-US",
-                                speaking_rate=1.2  # %20 faster for <60s videos
-                            ))
-                        
-                        if success:
-                            logger.info(f"✅ Narration created with Gemini Flash TTS")
-                            break  # Success, exit retry loop
-                        else:
-                            logger.warning("⚠️  Gemini TTS failed, trying Edge TTS...")
-                    except Exception as e:
-                        logger.warning(f"⚠️  Gemini TTS error: {e}, trying Edge TTS...")
-                        success = False
-                
-                # 2. Fallback to Edge TTS if Gemini failed
-                if not success and self.use_edge_tts:
-                    try:
-                        logger.info("Creating narration with Edge TTS (fallback)...")
-                        
-                        # Select best voice for narration
-                        voices = [
-                            "en-US-GuyNeural",
-                            "en-US-DavisNeural",
-                            "en-US-TonyNeural",
-                        ]
-                        selected_voice = voices[0]
-                        
-                        # Run async Edge TTS
-                        import asyncio
-                        import concurrent.futures
-                        
-                        # Check if event loop is running
-                        try:
-                            loop = asyncio.get_running_loop()
-                            with concurrent.futures.ThreadPoolExecutor() as executor:
-                                success = executor.submit(
-                                    lambda: asyncio.run(self.create_narration_edge(
-                                        text=tts_text,
-                                        output_path=narration_path,
-                                        voice=selected_voice
-                                    ))
-                                ).result()
-                        except RuntimeError:
-                            success = asyncio.run(self.create_narration_edge(
-                                text=tts_text,
-                                output_path=narration_path,
-                                voice=selected_voice
-                            ))
-                        
-                        if success:
-                            logger.info(f"✅ Narration created with Edge TTS ({selected_voice})")
-                            break  # Success, exit retry loop
-                        else:
-                            logger.warning("⚠️  Edge TTS also failed, trying Bark TTS...")
-                    except Exception as e:
-                        logger.warning(f"⚠️  Edge TTS error: {e}, trying Bark TTS...")
-                        success = False
-                
-                # 3. Fallback to Bark TTS if Edge also failed
-                if not success and self.use_bark_tts:
-                    try:
-                        logger.info("Creating narration with Bark TTS (Suno AI local fallback)...")
-                        bark_temp_path = self.temp_dir / "narration_bark_temp.wav"
-                        success = self.create_narration_bark(
-                            text=tts_text,
-                            output_path=bark_temp_path
-                        )
-                        
-                        if success:
-                            # Speed up Bark narration by 20% using FFmpeg
-                            logger.info("⚡ Speeding up Bark narration by 20% for <60s videos...")
-                            import subprocess
-                            speed_cmd = [
-                                'ffmpeg', '-y', '-i', str(bark_temp_path),
-                                '-filter:a', 'atempo=1.2',
-                                str(narration_path)
-                            ]
-                            subprocess.run(speed_cmd, check=True, capture_output=True)
-                            bark_temp_path.unlink()  # Clean up temp file
-                            logger.info(f"✅ Narration created with Bark TTS (sped up 20%)")
-                            break  # Success, exit retry loop
-                        else:
-                            logger.warning("⚠️  Bark TTS also failed")
-                    except Exception as e:
-                        logger.warning(f"⚠️  Bark TTS error: {e}")
-                        success = False
-                
-                # If all failed, increment retry counter
-                if not success:
-                    retry_count += 1
-            
-            # Final check after all retries
-            if not success:
-                logger.error(f"❌ TTS failed after {max_retries} attempts (waited {max_retries * 5} minutes total)")
+            # Create narration unless the caller already made it (e.g. while downloading)
+            if narration_path is None:
+                narration_path = self._create_narration(text)
+            if narration_path is None:
                 logger.error("❌ Cannot proceed without TTS - stopping video creation")
                 return None  # Stop here, don't continue
             
-            if success:
-                narration_audio = AudioFileClip(str(narration_path))
-                logger.info(f"Narration duration: {narration_audio.duration:.1f}s")
+            narration_info = self._probe_media(narration_path)
+            narration_duration = narration_info['duration'] if narration_info else None
+            if narration_duration:
+                logger.info(f"Narration duration: {narration_duration:.1f}s")
             else:
-                logger.warning("Narration creation failed, continuing without it")
-                narration_audio = None
+                logger.warning("Could not read narration duration, continuing without it")
+                narration_path = None
             
             # IMPORTANT: Calculate optimal scroll speed based on text and narration
-            video_width = video_size[0]
-            if narration_audio:
-                # Use narration duration for perfect sync
-                narration_duration = narration_audio.duration
-                scroll_speed, target_duration = self._calculate_optimal_scroll_speed(
-                    text=text,
-                    video_width=video_width,
-                    video_height=video_height,
-                    narration_duration=narration_duration,
-                    font_size=font_size
-                )
+            # (uses narration duration for perfect sync, or reading speed if there is none)
+            video_width = frame_size[0]
+            scroll_speed, target_duration = self._calculate_optimal_scroll_speed(
+                text=text,
+                video_width=video_width,
+                video_height=video_height,
+                narration_duration=narration_duration,
+                font_size=font_size
+            )
+            if narration_duration:
                 logger.info(f"✅ Target video duration: {target_duration:.1f}s (narration duration)")
             else:
-                # No narration, estimate based on reading speed
-                scroll_speed, target_duration = self._calculate_optimal_scroll_speed(
-                    text=text,
-                    video_width=video_width,
-                    video_height=video_height,
-                    narration_duration=None,
-                    font_size=font_size
-                )
                 logger.info(f"Target video duration: {target_duration:.1f}s (scroll duration)")
             
-            # Loop video if shorter than target duration
             if video_duration < target_duration:
-                loop_count = int(target_duration / video_duration) + 1
-                logger.info(f"Looping video {loop_count} times to match target duration")
-                video = concatenate_videoclips([video] * loop_count)
-                video = video.set_duration(target_duration)
-                logger.info(f"Video looped to {target_duration:.1f}s")
-            
-            # Use video as base (text will be added with FFmpeg later)
-            final_video = video
-            
-            # Add narration audio if available
-            if narration_audio:
-                # Ensure narration matches video duration
-                narration_duration = narration_audio.duration
-                if narration_duration > target_duration:
-                    # Trim narration to match video (shouldn't happen but handle it)
-                    logger.warning(f"Narration longer than video, trimming: {narration_duration:.1f}s -> {target_duration:.1f}s")
-                    narration_audio = narration_audio.set_duration(target_duration)
-                elif narration_duration < target_duration:
-                    # This shouldn't happen with our logic, but handle it just in case
-                    logger.warning(f"Narration shorter than video, this shouldn't happen")
-                    # Keep narration as is, video will continue after narration ends
-                
-                # Mix with original audio if exists
-                if video.audio:
-                    final_audio = CompositeAudioClip([video.audio, narration_audio])
-                    final_video = final_video.set_audio(final_audio)
-                else:
-                    final_video = final_video.set_audio(narration_audio)
-            
-            # Write video without text first
-            temp_output = self.temp_dir / "temp_no_text.mp4"
-            logger.info(f"Writing video to {temp_output}")
-            final_video.write_videofile(
-                str(temp_output),
-                codec='libx264',
-                audio_codec='aac',
-                fps=24,
-                preset='medium'
-            )
-            
-            # Add scrolling text with FFmpeg
-            logger.info("Adding scrolling text overlay with FFmpeg...")
-            if not self.add_scrolling_text_ffmpeg(
-                video_path=temp_output,
-                text=text,
-                output_path=output_path,
-                video_size=video_size,
-                duration=target_duration,
-                font_size=font_size,
-                scroll_speed=scroll_speed,
-                use_markdown=use_markdown
-            ):
-                # If FFmpeg fails, use video without text
-                logger.warning("FFmpeg text overlay failed, using video without text")
-                import shutil
-                shutil.copy(temp_output, output_path)
-            
-            # Cleanup
-            video.close()
-            if narration_audio:
-                narration_audio.close()
+                logger.info(f"Looping video ({video_duration:.1f}s) to match target duration {target_duration:.1f}s")
+            
+            # Single FFmpeg pass: loop video + scrolling text + audio mix + encode
+            # If the pre-rendered image overlay fails, retry with drawtext, then without text
+            for use_image in (True, False):
+                if self._render_video_ffmpeg(
+                    video_path=video_path,
+                    narration_path=narration_path,
+                    output_path=output_path,
+                    duration=target_duration,
+                    video_volume=video_volume if keep_video_audio else 0.0,
+                    text=text,
+                    video_size=video_size,
+                    font_size=font_size,
+                    scroll_speed=scroll_speed,
+                    use_markdown=use_markdown,
+                    use_image=use_image,
+                    output_height=output_height,
+                    narration_codec=narration_info['audio_codec'] if narration_path else None
+                ):
+                    break
+                logger.warning("FFmpeg render failed" + (", falling back to drawtext" if use_image else ""))
+            else:
+                logger.warning("FFmpeg text overlay failed, rendering video without text")
+                if not self._render_video_ffmpeg(
+                    video_path=video_path,
+                    narration_path=narration_path,
+                    output_path=output_path,
+                    duration=target_duration,
+                    video_volume=video_volume if keep_video_audio else 0.0,
+                    output_height=output_height,
+                    narration_codec=narration_info['audio_codec'] if narration_path else None
+                ):
+                    return False
             
             logger.info(f"✅ Video created successfully: {output_path}")
             return True
@@ -779,68 +1163,406 @@ class VideoCreator:
             traceback.print_exc()
             return False
     
-    def _parse_simple_markdown(self, text: str) -> list:
+    def _create_narration(self, text: str) -> Optional[Path]:
         """
-        Parse simple markdown formatting (**bold**, *italic*)
-        Returns list of (text, style) tuples where style is 'bold', 'italic', or 'normal'
+        Create the narration audio for a video (Gemini Flash > Edge > Bark, retried after 5 min)
+        Safe to call from a worker thread while the background video downloads
+        
+        Args:
+            text: Text to narrate (markdown is stripped first)
+            
+        Returns:
+            Path to the narration audio or None if every TTS engine failed
         """
-        import re
+        # Use .mp3 for Edge/Gemini TTS, .wav for Piper TTS
+        narration_path = self.temp_dir / "narration.mp3"
+        success = False
+        max_retries = 3
+        retry_count = 0
         
-        segments = []
-        pos = 0
+        # Clean text for TTS (remove markdown, asterisks, etc.)
+        tts_text = self._clean_text_for_tts(text)
         
-        # Pattern: **bold** or *italic*
-        pattern = r'(\*\*([^\*]+)\*\*|\*([^\*]+)\*)'
+        # Reuse narration made earlier for the same text with the same engine settings
+        engines = f"gemini={self.use_gemini_tts}|edge={self.use_edge_tts}:en-US-GuyNeural:+20%|bark={self.use_bark_tts}"
+        cache_key = hashlib.md5(f"{tts_text}|{engines}".encode()).hexdigest()
+        cached_path = self._tts_cache_dir / f"{cache_key}.mp3"
+        try:
+            # Copy it out: another worker may evict the cache entry while this video encodes
+            shutil.copyfile(cached_path, narration_path)
+            os.utime(cached_path)  # Mark as recently used for eviction
+            logger.info(f"📦 Using cached narration: {cached_path.name}")
+            return narration_path
+        except FileNotFoundError:
+            pass
         
-        for match in re.finditer(pattern, text):
-            # Add normal text before match
-            if match.start() > pos:
-                segments.append((text[pos:match.start()], 'normal'))
+        while not success and retry_count < max_retries:
+            if retry_count > 0:
+                logger.warning(f"⏳ TTS failed, waiting 5 minutes before retry {retry_count}/{max_retries}...")
+                import time
+                time.sleep(300)  # Wait 5 minutes
+                logger.info(f"🔄 Retrying TTS (attempt {retry_count + 1}/{max_retries})...")
+            
+            # 1. Try Gemini TTS first (highest priority)
+            if self.use_gemini_tts and self.gemini_analyzer:
+                try:
+                    logger.info("Creating narration with Gemini Flash TTS (primary)...")
+                    # Run async Gemini TTS - ALWAYS English
+                    success = self._run_async(self.gemini_analyzer.text_to_speech(
+                        text=tts_text,
+                        output_path=str(narration_path),
+                        language_code="en-US",
+                        speaking_rate=1.2  # %20 faster for <60s videos
+                    ))
+                    
+                    if success:
+                        logger.info(f"✅ Narration created with Gemini Flash TTS")
+                        break  # Success, exit retry loop
+                    else:
+                        logger.warning("⚠️  Gemini TTS failed, trying Edge TTS...")
+                except Exception as e:
+                    logger.warning(f"⚠️  Gemini TTS error: {e}, trying Edge TTS...")
+                    success = False
             
-            # Add styled text
-            if match.group(2):  # **bold**
-                segments.append((match.group(2), 'bold'))
-            elif match.group(3):  # *italic*
-                segments.append((match.group(3), 'italic'))
+            # 2. Fallback to Edge TTS if Gemini failed
+            if not success and self.use_edge_tts:
+                try:
+                    logger.info("Creating narration with Edge TTS (fallback)...")
+                    
+                    # Select best voice for narration
+                    voices = [
+                        "en-US-GuyNeural",
+                        "en-US-DavisNeural",
+                        "en-US-TonyNeural",
+                    ]
+                    selected_voice = voices[0]
+                    
+                    # Run async Edge TTS
+                    success = self._run_async(self.create_narration_edge(
+                        text=tts_text,
+                        output_path=narration_path,
+                        voice=selected_voice
+                    ))
+                    
+                    if success:
+                        logger.info(f"✅ Narration created with Edge TTS ({selected_voice})")
+                        break  # Success, exit retry loop
+                    else:
+                        logger.warning("⚠️  Edge TTS also failed, trying Bark TTS...")
+                except Exception as e:
+                    logger.warning(f"⚠️  Edge TTS error: {e}, trying Bark TTS...")
+                    success = False
+            
+            # 3. Fallback to Bark TTS if Edge also failed
+            if not success and self.use_bark_tts:
+                try:
+                    logger.info("Creating narration with Bark TTS (Suno AI local fallback)...")
+                    # Speed up Bark narration by 20% while encoding (<60s videos)
+                    success = self.create_narration_bark(
+                        text=tts_text,
+                        output_path=narration_path,
+                        tempo=1.2
+                    )
+                    
+                    if success:
+                        logger.info(f"✅ Narration created with Bark TTS (sped up 20%)")
+                        break  # Success, exit retry loop
+                    else:
+                        logger.warning("⚠️  Bark TTS also failed")
+                except Exception as e:
+                    logger.warning(f"⚠️  Bark TTS error: {e}")
+                    success = False
+            
+            # If all failed, increment retry counter
+            if not success:
+                retry_count += 1
+        
+        # Final check after all retries
+        if not success:
+            logger.error(f"❌ TTS failed after {max_retries} attempts (waited {max_retries * 5} minutes total)")
+            return None
+        
+        self._store_cached_narration(cache_key, narration_path)
+        return narration_path
+    
+    def _store_cached_narration(self, cache_key: str, narration_path: Path):
+        """
+        Copy a new narration into the TTS cache and evict the least recently used entries
+        
+        The cache directory is shared by every create_batch worker, so entries are
+        published with an atomic rename and evicted by on-disk mtime. Callers only
+        ever use their own copy, so evicting an entry never breaks a running job.
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self._tts_cache_dir, suffix='.tmp')
+            os.close(fd)
+            try:
+                shutil.copyfile(narration_path, tmp_path)
+                os.replace(tmp_path, self._tts_cache_dir / f"{cache_key}.mp3")
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            
+            entries = []
+            for path in self._tts_cache_dir.glob('*.mp3'):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    pass  # Evicted by another worker meanwhile
+            entries.sort()
+            for _, old_path in entries[:-TTS_CACHE_SIZE]:
+                old_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not cache narration: {e}")
+    
+    def _probe_media(self, path: Path) -> Optional[dict]:
+        """
+        Read duration, frame size and audio presence with ffprobe
+        Only the container headers are parsed - nothing is decoded
+        
+        Returns:
+            Dict with 'duration', 'width', 'height', 'has_audio', 'audio_codec' or None on failure
+        """
+        cmd = [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration:stream=codec_type,codec_name,width,height',
+            '-of', 'json',
+            str(path)
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if result.returncode != 0:
+                logger.error(f"ffprobe error: {result.stderr}")
+                return None
             
-            pos = match.end()
+            data = json.loads(result.stdout)
+            streams = data.get('streams', [])
+            video_stream = next((st for st in streams if st.get('codec_type') == 'video'), {})
+            audio_stream = next((st for st in streams if st.get('codec_type') == 'audio'), None)
+            return {
+                'duration': float(data.get('format', {}).get('duration') or 0),
+                'width': video_stream.get('width'),
+                'height': video_stream.get('height'),
+                'has_audio': audio_stream is not None,
+                'audio_codec': audio_stream.get('codec_name') if audio_stream else None
+            }
+        except Exception as e:
+            logger.error(f"Error probing {path}: {e}")
+            return None
+    
+    def _video_decode_args(self) -> list:
+        """
+        FFmpeg input options for the background video
+        
+        With a hardware encoder present, the GPU usually has a matching decoder too;
+        `-hwaccel auto` uses it when it can and silently decodes on the CPU otherwise.
+        Frames are downloaded to system memory for the CPU filters (scale/overlay).
+        """
+        if self.use_hw_encoder and _detect_hw_encoder():
+            return ['-hwaccel', 'auto']
+        return []
+    
+    def _video_codec_args(self) -> list:
+        """
+        FFmpeg video encoder arguments: hardware encoder if available, else libx264
+        
+        Everything is encoded as H.264 High profile, which every Reels/Shorts
+        player decodes (baseline would just cost bitrate). The level is left to
+        the encoder, which derives it from the actual frame size and rate.
+        """
+        encoder = _detect_hw_encoder() if self.use_hw_encoder else None
+        if encoder == 'h264_nvenc':
+            # Constant-quality VBR, roughly matching libx264's default CRF 23
+            return ['-c:v', encoder, '-profile:v', 'high', '-preset', 'p4', '-tune', 'hq',
+                    '-rc', 'vbr', '-cq', '23', '-b:v', '0']
+        if encoder == 'h264_qsv':
+            return ['-c:v', encoder, '-profile:v', 'high', '-preset', 'veryfast', '-global_quality', '23']
+        if encoder == 'h264_videotoolbox':
+            return ['-c:v', encoder, '-profile:v', 'high', '-q:v', '60', '-pix_fmt', 'yuv420p']
+        if encoder:
+            return ['-c:v', encoder, '-b:v', '4M']
+        return [
+            '-c:v', 'libx264',
+            '-preset', self.x264_preset,
+            '-crf', '23',
+            '-profile:v', 'high',
+            '-pix_fmt', 'yuv420p',  # Overlaying an RGBA image must not leak alpha/4:4:4 into the output
+            '-tune', 'fastdecode',
+            '-threads', str(self.encoder_threads)  # 0 = use all cores
+        ]
+    
+    def _render_video_ffmpeg(self, video_path: Path, narration_path: Optional[Path], output_path: Path,
+                             duration: float, video_volume: float = 0.0, text: str = None,
+                             video_size: tuple = None, font_size: int = 28,
+                             scroll_speed: float = 50, use_markdown: bool = False,
+                             use_image: bool = True, output_height: Optional[int] = None,
+                             narration_codec: Optional[str] = None, include_header: bool = True,
+                             stroke_width: Optional[int] = None, padding: Optional[int] = None) -> bool:
+        """
+        Render the final video with ONE FFmpeg invocation
+        
+        The background video is looped at the demuxer level (-stream_loop), the
+        scrolling text is burned in, the narration is mixed with the original audio
+        (scaled by video_volume, dropped at 0.0) and everything is encoded once.
+        
+        Args:
+            video_path: Background video
+            narration_path: Narration audio (None for no narration)
+            output_path: Output video path
+            duration: Output duration in seconds
+            video_volume: Original video audio volume (0.0 drops it)
+            text: Text to scroll (None renders without text)
+            video_size: (width, height) of the background video
+            font_size: Font size
+            scroll_speed: Scrolling speed (pixels per second)
+            use_markdown: Apply markdown formatting (**bold**) to the text
+            use_image: Overlay a pre-rendered text image instead of drawtext
+            output_height: Scale the background down to this height first (None keeps its size)
+            narration_codec: Codec of the narration audio; AAC is copied when it is the only audio
+            include_header: Burn in the HEADER_TEXT credit line with the text
+            stroke_width: Text outline width (None = default of the text mode)
+            padding: Horizontal text margin (None = default of the text mode)
+        """
+        cmd = [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            *self._video_decode_args(),
+            '-stream_loop', '-1', '-i', str(video_path)
+        ]
+        next_input = 1
+        
+        narration_input = None
+        if narration_path:
+            cmd += ['-i', str(narration_path)]
+            narration_input = next_input
+            next_input += 1
+        
+        filters = []
+        video_src = '0:v'
+        video_map = '0:v'
+        if output_height and video_size and video_size[1] > output_height:
+            video_size = _scaled_size(video_size, output_height)
+            # Bilinear is plenty for downscaling B-roll and cheaper than the bicubic default
+            filters.append(f"[0:v]scale={video_size[0]}:{video_size[1]}:flags=bilinear[scaled]")
+            video_src = 'scaled'
+            video_map = '[scaled]'
+        
+        stdin_data = None
+        if text:
+            text_inputs, text_filter, stdin_data = self._build_text_filter(
+                text=text,
+                video_size=video_size,
+                duration=duration,
+                font_size=font_size,
+                scroll_speed=scroll_speed,
+                use_markdown=use_markdown,
+                use_image=use_image,
+                src=video_src,
+                dst='vout',
+                image_input=next_input,
+                include_header=include_header,
+                stroke_width=stroke_width,
+                padding=padding
+            )
+            cmd += text_inputs
+            filters.append(text_filter)
+            video_map = '[vout]'
+        
+        # Original audio gain is applied by FFmpeg's volume filter (skipped at unity gain)
+        video_gain = 'anull' if video_volume == 1.0 else f"volume={video_volume}"
+        audio_map = None
+        if narration_input is not None and video_volume > 0.0:
+            filters.append(
+                f"[0:a]{video_gain}[va];"
+                f"[va][{narration_input}:a]amix=inputs=2:duration=longest:normalize=0[aout]"
+            )
+            audio_map = '[aout]'
+        elif narration_input is not None:
+            audio_map = f'{narration_input}:a'
+        elif video_volume == 1.0:
+            audio_map = '0:a'
+        elif video_volume > 0.0:
+            filters.append(f"[0:a]{video_gain}[aout]")
+            audio_map = '[aout]'
+        
+        if filters:
+            cmd += ['-filter_complex', ';'.join(filters)]
+        cmd += ['-map', video_map]
+        if audio_map == '0:a' or (audio_map and audio_map == f'{narration_input}:a'
+                                   and narration_codec in COPY_AUDIO_CODECS):
+            # Untouched Pexels audio (and AAC narration) is muxed as-is instead of re-encoded
+            cmd += ['-map', audio_map, '-c:a', 'copy']
+        elif audio_map:
+            cmd += ['-map', audio_map, '-c:a', 'aac', '-b:a', '128k']
+        else:
+            cmd += ['-an']
+        cmd += [
+            '-t', f"{duration:.3f}",
+            *self._video_codec_args(),
+            '-movflags', '+faststart',
+            '-y',
+            str(output_path)
+        ]
+        
+        logger.info("🎬 Rendering video with a single FFmpeg pass...")
+        error = _run_ffmpeg(cmd, input_data=stdin_data)
         
-        # Add remaining normal text
-        if pos < len(text):
-            segments.append((text[pos:], 'normal'))
+        if error is None:
+            logger.info("✅ FFmpeg render finished")
+            return True
         
-        return segments if segments else [(text, 'normal')]
+        logger.error(f"FFmpeg error: {error}")
+        logger.error(f"FFmpeg command: {' '.join(cmd)}")
+        return False
+    
+    def _parse_simple_markdown(self, text: str) -> list:
+        """
+        Parse simple markdown formatting (**bold**, *italic*)
+        Returns list of (text, style) tuples where style is 'bold', 'italic', or 'normal'
+        """
+        return list(_parse_markdown_segments(text))
     
     def _create_text_image_with_markdown(self, text: str, width: int, font_size: int = 48,
-                                          use_markdown: bool = True) -> Optional[Path]:
+                                          use_markdown: bool = True, stroke_width: int = 3,
+                                          padding: int = 40) -> Optional[Image.Image]:
         """
         Create an image with text supporting markdown formatting using PIL
+        The image stays in memory; FFmpeg gets its raw pixels through a pipe.
         
         Args:
             text: Text with markdown formatting
             width: Image width
             font_size: Base font size
             use_markdown: Enable markdown parsing
+            stroke_width: Width of the black text outline
+            padding: Margin around the text (the text is at most width - 2 * padding wide)
         
         Returns:
-            Path to created image or None
+            Rendered grayscale+alpha ('LA') image or None
         """
+        # Reuse the image if it was already rendered (e.g. while the video downloaded)
+        cache_key = (text, width, font_size, use_markdown, stroke_width, padding)
+        if self._text_image and self._text_image[0] == cache_key:
+            logger.info("📦 Reusing rendered text image")
+            return self._text_image[1]
+        
         try:
             # Try to load fonts
             try:
-                font_regular = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", font_size)
-                font_bold = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial Bold.ttf", font_size)
+                font_regular = _load_font(font_size)
+                font_bold = _load_font(font_size, bold=True)
+                measure = lambda word, style: _word_advance(word, font_size, style == 'bold')
             except:
                 # Fallback to default font
                 logger.warning("Could not load custom fonts, using default")
                 font_regular = ImageFont.load_default()
                 font_bold = font_regular
+                measure = lambda word, style: font_regular.getlength(word)
             
             # Word wrap and parse markdown
-            padding = 40
             max_text_width = width - (padding * 2)
             
             lines = []
+            line_widths = []
             current_line = []
             current_width = 0
             
@@ -849,15 +1571,17 @@ class VideoCreator:
             else:
                 segments = [(text, 'normal')]
             
+            # Common words (the, of, and...) repeat a lot; each is measured once per
+            # style and size, and the widths carry over to the next video
             for segment_text, style in segments:
                 words = segment_text.split()
-                font = font_bold if style == 'bold' else font_regular
                 
                 for word in words:
-                    word_width = font.getbbox(word + ' ')[2]
+                    word_width = measure(word + ' ', style)
                     
                     if current_width + word_width > max_text_width and current_line:
                         lines.append(current_line)
+                        line_widths.append(current_width)
                         current_line = [(word + ' ', style)]
                         current_width = word_width
                     else:
@@ -866,44 +1590,42 @@ class VideoCreator:
             
             if current_line:
                 lines.append(current_line)
+                line_widths.append(current_width)
             
-            # Calculate image height
+            # Calculate image size: only as wide as the longest line (the overlay
+            # centers it), instead of a mostly transparent full-width canvas
             line_height = int(font_size * 1.5)
             image_height = len(lines) * line_height + padding * 2
+            image_width = min(width, int(max(line_widths, default=0)) + 1 + padding * 2)
             
-            # Create image
-            image = Image.new('RGBA', (width, image_height), (0, 0, 0, 0))
+            # Create image: the text is white with a black outline, so grayscale + alpha
+            # holds it in half the memory of RGBA
+            image = Image.new('LA', (image_width, image_height), (0, 0))
             draw = ImageDraw.Draw(image)
             
             # Draw text with styles
             y = padding
             for line in lines:
                 x = padding
-                for word, style in line:
+                # One draw call per run of same-style words (usually the whole line)
+                for style, run in groupby(line, key=lambda item: item[1]):
+                    run_text = ''.join(word for word, _ in run)
                     font = font_bold if style == 'bold' else font_regular
                     
-                    # Draw text with border (stroke)
-                    for offset_x in [-3, 0, 3]:
-                        for offset_y in [-3, 0, 3]:
-                            if offset_x != 0 or offset_y != 0:
-                                draw.text((x + offset_x, y + offset_y), word, 
-                                         font=font, fill=(0, 0, 0, 255))
-                    
-                    # Draw main text
-                    draw.text((x, y), word, font=font, fill=(255, 255, 255, 255))
+                    # Draw text with border (stroke) in a single raster pass
+                    draw.text((x, y), run_text, font=font, fill=(255, 255),
+                              stroke_width=stroke_width, stroke_fill=(0, 255))
                     
-                    x += font.getbbox(word)[2]
+                    x += font.getlength(run_text)
                 
                 y += line_height
             
-            # Save image
-            image_path = self.temp_dir / "scrolling_text_rendered.png"
-            image.save(image_path)
+            self._text_image = (cache_key, image)
             
-            logger.info(f"✅ Created markdown-formatted text image: {image_path}")
-            logger.info(f"   Size: {width}x{image_height}px, Lines: {len(lines)}")
+            logger.info("✅ Created markdown-formatted text image")
+            logger.info(f"   Size: {image_width}x{image_height}px, Lines: {len(lines)}")
             
-            return image_path
+            return image
             
         except Exception as e:
             logger.error(f"Error creating text image: {e}")
@@ -911,13 +1633,154 @@ class VideoCreator:
             traceback.print_exc()
             return None
     
+    def _build_text_filter(self, text: str, video_size: tuple, duration: float,
+                           font_size: int = 28, scroll_speed: float = 50,
+                           use_markdown: bool = False, use_image: bool = True,
+                           src: str = '0:v', dst: str = 'out',
+                           image_input: int = 1, include_header: bool = True,
+                           stroke_width: Optional[int] = None,
+                           padding: Optional[int] = None) -> tuple[list, str, Optional[bytes]]:
+        """
+        Build the filter_complex fragment that burns scrolling text into a video stream
+        By default the text is rasterised ONCE into a transparent image with PIL and
+        scrolled with the overlay filter, so glyphs aren't re-rendered every frame.
+        The image's raw grayscale+alpha pixels are fed to FFmpeg on stdin (no PNG
+        encode/decode).
+        The drawtext filter with a text file is kept as a fallback.
+        
+        Args:
+            text: Text to display
+            video_size: (width, height)
+            duration: Video duration
+            font_size: Font size
+            scroll_speed: Scrolling speed (pixels per second)
+            use_markdown: Apply markdown formatting (**bold**) to the text image
+            use_image: Overlay a pre-rendered text image instead of drawtext
+            src: Label of the input video stream
+            dst: Label of the output video stream
+            image_input: FFmpeg input index the rendered text image will get
+            include_header: Burn in the HEADER_TEXT credit line (never on markdown images)
+            stroke_width: Text outline width (None = default of the text mode)
+            padding: Horizontal margin of the text (None = default of the text mode)
+            
+        Returns:
+            Tuple of (extra FFmpeg input args, filter fragment ending in [dst],
+            bytes to write to FFmpeg's stdin or None)
+        """
+        width, height = video_size
+        
+        # drawtext options shared by the header and the scrolling text
+        text_style = f"fontcolor=white:bordercolor=black:x=(w-text_w)/2{_drawtext_font_option()}"
+        
+        # Header overlay
+        header_filter = (
+            f"drawtext="
+            f"text='{HEADER_TEXT.translate(DRAWTEXT_ESCAPE)}':"
+            f"expansion=none:"
+            f"fontsize=14:"
+            f"borderw=1:"
+            f"y=15:"
+            f"{text_style}"
+        )
+        
+        # Pre-rendered image approach (PIL rasterises the text once)
+        if use_image:
+            logger.info("🎨 Rendering text image with PIL" + (" (markdown)" if use_markdown else ""))
+            style = {}
+            if stroke_width is not None:
+                style['stroke_width'] = stroke_width
+            if padding is not None:
+                style['padding'] = padding
+            text_image = self._create_text_image_with_markdown(text, width, font_size, use_markdown=use_markdown,
+                                                               **style)
+            
+            if not text_image:
+                logger.warning("Failed to create text image, falling back to drawtext")
+            else:
+                # Get image dimensions
+                img_width, img_height = text_image.size
+                
+                # Calculate scroll parameters
+                start_y = height
+                end_y = -img_height
+                scroll_distance = start_y - end_y
+                
+                # Adjust scroll speed if needed
+                if duration > 0:
+                    calculated_speed = scroll_distance / duration
+                    logger.info(f"📐 Image scroll: {img_width}x{img_height}px, speed: {calculated_speed:.1f}px/s")
+                else:
+                    calculated_speed = scroll_speed
+                
+                # Use FFmpeg overlay filter with scrolling
+                # (markdown videos never carried the header, plain text ones do)
+                overlay_filter = (
+                    f"[{image_input}:v]format=rgba[text];"
+                    f"[{src}][text]overlay=x=(W-w)/2:y={start_y}-{calculated_speed}*t"
+                    + (f",{header_filter}" if include_header and not use_markdown else "")
+                    + f"[{dst}]"
+                )
+                image_input_args = [
+                    '-f', 'rawvideo', '-pix_fmt', 'ya8',
+                    '-s', f"{img_width}x{img_height}",
+                    '-i', 'pipe:0'
+                ]
+                return (image_input_args, overlay_filter, text_image.tobytes())
+        
+        # Plain text mode
+        # Calculate max text width with minimal padding
+        if padding is None:
+            padding = 30
+        max_text_width = width - (padding * 2)
+        
+        # Word wrap text
+        words = text.split()
+        lines = self._wrap_text(text, max_text_width, font_size)
+        
+        logger.info(f"📝 Text wrapping: {len(text)} chars → {len(words)} words → {len(lines)} lines")
+        logger.info(f"   Max line width: {max_text_width}px, Font size: {font_size}px, Video width: {width}px")
+        
+        # Write wrapped text to file (NO ESCAPING NEEDED!)
+        text_file = self.temp_dir / "scrolling_text.txt"
+        text_file.write_text('\n'.join(lines), encoding='utf-8')
+        
+        logger.info(f"💾 Wrote {len(lines)} lines to text file: {text_file}")
+        
+        # Calculate scroll parameters - match the calculation in _calculate_optimal_scroll_speed
+        start_y = height
+        line_height = int(font_size * 1.2)  # FFmpeg's default line height (~1.2x font size)
+        text_box_height = len(lines) * line_height
+        
+        logger.info(f"📹 FFmpeg scroll parameters:")
+        logger.info(f"   Lines: {len(lines)}, Line height: {line_height}px, Text height: {text_box_height}px")
+        logger.info(f"   Start Y: {start_y}px, Scroll speed: {scroll_speed:.1f}px/s")
+        logger.info(f"   Duration: {duration:.1f}s, Final Y: {start_y - (scroll_speed * duration):.1f}px")
+        
+        # Use textfile parameter - much simpler and no escape issues!
+        # Single drawtext filter for all text with newline support
+        # NOTE: line_h parameter not supported in some FFmpeg versions, using default line spacing
+        # expansion=none: the text is literal, so skip %{...} expansion on every frame
+        drawtext_filter = (
+            f"drawtext="
+            f"textfile='{text_file.as_posix()}':"
+            f"expansion=none:"
+            f"fontsize={font_size}:"
+            f"borderw={3 if stroke_width is None else stroke_width}:"
+            f"y={start_y}-{scroll_speed}*t:"
+            f"{text_style}"
+        )
+        
+        # Combine filters
+        if include_header:
+            drawtext_filter += f",{header_filter}"
+        return ([], f"[{src}]{drawtext_filter}[{dst}]", None)
+    
     def add_scrolling_text_ffmpeg(self, video_path: Path, text: str, output_path: Path,
                                    video_size: tuple, duration: float,
                                    font_size: int = 28, scroll_speed: float = 50,
                                    use_markdown: bool = False) -> bool:
         """
-        Add scrolling text to video using FFmpeg drawtext filter with text file
-        This avoids command line length limits and escape character issues
+        Add scrolling text to an existing video using FFmpeg
         
         Args:
             video_path: Input video path
@@ -927,174 +1790,46 @@ class VideoCreator:
             duration: Video duration
             font_size: Font size
             scroll_speed: Scrolling speed (pixels per second)
+            use_markdown: Apply markdown formatting (**bold**) to the text
         """
         try:
-            width, height = video_size
-            
-            # If markdown is enabled, use PIL-rendered image approach
-            if use_markdown:
-                logger.info("🎨 Using PIL with markdown formatting")
-                text_image_path = self._create_text_image_with_markdown(text, width, font_size, use_markdown=True)
-                
-                if not text_image_path:
-                    logger.warning("Failed to create markdown image, falling back to plain text")
-                    use_markdown = False
-                else:
-                    # Get image dimensions
-                    with Image.open(text_image_path) as img:
-                        img_width, img_height = img.size
-                    
-                    # Calculate scroll parameters
-                    start_y = height
-                    end_y = -img_height
-                    scroll_distance = start_y - end_y
-                    
-                    # Adjust scroll speed if needed
-                    if duration > 0:
-                        calculated_speed = scroll_distance / duration
-                        logger.info(f"📐 Image scroll: {img_width}x{img_height}px, speed: {calculated_speed:.1f}px/s")
-                    else:
-                        calculated_speed = scroll_speed
-                    
-                    # Use FFmpeg overlay filter with scrolling
-                    ffmpeg_cmd = [
-                        'ffmpeg',
-                        '-i', str(video_path),
-                        '-i', str(text_image_path),
-                        '-filter_complex',
-                        f"[1:v]format=rgba[text];[0:v][text]overlay=x=0:y={start_y}-{calculated_speed}*t[out]",
-                        '-map', '[out]',
-                        '-codec:a', 'copy',
-                        '-y',
-                        str(output_path)
-                    ]
-                    
-                    logger.info("🎬 Running FFmpeg with markdown-formatted image overlay...")
-                    result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        logger.info(f"✅ Markdown text overlay added successfully")
-                        return True
-                    else:
-                        logger.error(f"FFmpeg error: {result.stderr}")
-                        logger.warning("Falling back to plain text mode")
-                        use_markdown = False
-            
-            # Plain text mode (original implementation)
-            if not use_markdown:
-                # Calculate max text width with minimal padding
-                padding = 30
-                max_text_width = width - (padding * 2)
-                chars_per_line = int(max_text_width / (font_size * 0.6))
-                
-                # Word wrap text
-                words = text.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                
-                for word in words:
-                    word_length = len(word) + 1
-                    
-                    if word_length > chars_per_line:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                            current_line = []
-                            current_length = 0
-                        lines.append(word)
-                    elif current_length + word_length > chars_per_line and current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = word_length
-                    else:
-                        current_line.append(word)
-                        current_length += word_length
-                
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                logger.info(f"📝 Text wrapping: {len(text)} chars → {len(words)} words → {len(lines)} lines")
-                logger.info(f"   Chars per line: {chars_per_line}, Font size: {font_size}px, Video width: {width}px")
-                
-                # Write wrapped text to file (NO ESCAPING NEEDED!)
-                text_file = self.temp_dir / "scrolling_text.txt"
-                with open(text_file, 'w', encoding='utf-8') as f:
-                    for line in lines:
-                        f.write(line + '\n')
-                
-                logger.info(f"💾 Wrote {len(lines)} lines to text file: {text_file}")
-                
-                # Calculate scroll parameters - match the calculation in _calculate_optimal_scroll_speed
-                start_y = height
-                line_height = int(font_size * 1.2)  # FFmpeg's default line height (~1.2x font size)
-                text_box_height = len(lines) * line_height
-                
-                logger.info(f"📹 FFmpeg scroll parameters:")
-                logger.info(f"   Lines: {len(lines)}, Line height: {line_height}px, Text height: {text_box_height}px")
-                logger.info(f"   Start Y: {start_y}px, Scroll speed: {scroll_speed:.1f}px/s")
-                logger.info(f"   Duration: {duration:.1f}s, Final Y: {start_y - (scroll_speed * duration):.1f}px")
-                
-                # Use textfile parameter - much simpler and no escape issues!
-                # Single drawtext filter for all text with newline support
-                # NOTE: line_h parameter not supported in some FFmpeg versions, using default line spacing
-                drawtext_filter = (
-                    f"drawtext="
-                    f"textfile='{text_file}':"
-                    f"fontsize={font_size}:"
-                    f"fontcolor=white:"
-                    f"borderw=3:"
-                    f"bordercolor=black:"
-                    f"x=(w-text_w)/2:"
-                    f"y={start_y}-{scroll_speed}*t:"
-                    f"fontfile=/System/Library/Fonts/Supplemental/Arial.ttf"
-                )
-                
-                # Add header overlay
-                header_text = "by roll.wiki . video from pexels, article from wikipedia."
-                # Minimal escaping for header only
-                header_escaped = header_text.replace("'", "'\\''").replace(":", "\\:")
-                header_filter = (
-                    f"drawtext="
-                    f"text='{header_escaped}':"
-                    f"fontsize=14:"
-                    f"fontcolor=white:"
-                    f"borderw=1:"
-                    f"bordercolor=black:"
-                    f"x=(w-text_w)/2:"
-                    f"y=15:"
-                    f"fontfile=/System/Library/Fonts/Supplemental/Arial.ttf"
+            for use_image in (True, False):
+                text_inputs, text_filter, stdin_data = self._build_text_filter(
+                    text=text,
+                    video_size=video_size,
+                    duration=duration,
+                    font_size=font_size,
+                    scroll_speed=scroll_speed,
+                    use_markdown=use_markdown,
+                    use_image=use_image
                 )
-                
-                # Combine filters
-                combined_filter = f"{drawtext_filter},{header_filter}"
-                
-                # FFmpeg command
                 cmd = [
-                    'ffmpeg',
+                    'ffmpeg', '-hide_banner', '-loglevel', 'error',
+                    *self._video_decode_args(),
                     '-i', str(video_path),
-                    '-vf', combined_filter,
+                    *text_inputs,
+                    '-filter_complex', text_filter,
+                    '-map', '[out]',
+                    '-map', '0:a?',
+                    *self._video_codec_args(),
                     '-codec:a', 'copy',
+                    '-movflags', '+faststart',
                     '-y',
                     str(output_path)
                 ]
                 
-                logger.info("Running FFmpeg with text file for scrolling text...")
-                logger.info(f"FFmpeg filter length: {len(combined_filter)} chars (much shorter!)")
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
+                logger.info("Running FFmpeg for scrolling text...")
+                error = _run_ffmpeg(cmd, input_data=stdin_data, timeout=300)
                 
-                if result.returncode == 0:
+                if error is None:
                     logger.info("✅ Scrolling text added successfully")
                     return True
-                else:
-                    logger.error(f"FFmpeg error: {result.stderr}")
-                    logger.error(f"FFmpeg command: {' '.join(cmd)}")
-                    return False
+                
+                logger.error(f"FFmpeg error: {error}")
+                logger.error(f"FFmpeg command: {' '.join(cmd)}")
+                if use_image:
+                    logger.warning("Falling back to drawtext mode")
+            return False
                 
         except Exception as e:
             logger.error(f"Error adding scrolling text: {e}")
@@ -1145,19 +1880,10 @@ class VideoCreator:
         # Get alternative keywords from Gemini if available - PRIORITIZE GEMINI
         if self.gemini_analyzer:
             try:
-                import asyncio
-                # Check if event loop is running
-                try:
-                    loop = asyncio.get_running_loop()
-                    # If we're in an event loop, use run_in_executor
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        keywords = executor.submit(
-                            lambda: asyncio.run(self.gemini_analyzer.get_video_search_keywords(cleaned_query, max_keywords=5))
-                        ).result()
-                except RuntimeError:
-                    # No event loop running, safe to use asyncio.run
-                    keywords = asyncio.run(self.gemini_analyzer.get_video_search_keywords(cleaned_query, max_keywords=5))
+                keywords = self._run_async(
+                    self.gemini_analyzer.get_video_search_keywords(cleaned_query, max_keywords=5),
+                    timeout=30
+                )
                 
                 search_keywords = keywords
                 logger.info(f"🎬 Trying {len(search_keywords)} keywords from Gemini: {search_keywords}")
@@ -1183,11 +1909,39 @@ class VideoCreator:
             logger.error(f"💔 No video found after trying all {len(search_keywords)} keywords!")
             return None
         
-        # Download video
         temp_video_path = self.temp_dir / f"temp_{video_info['id']}.mp4"
-        if not self.download_video(video_info['url'], temp_video_path):
+        video_source = temp_video_path
+        output_height = OUTPUT_HEIGHTS.get(orientation, 720)
+        if self.stream_pexels_video and not self._video_cache_path(video_info['url']).exists():
+            # FFmpeg reads the video straight from Pexels while rendering (no disk copy)
+            logger.info("🌐 Streaming Pexels video directly into FFmpeg")
+            video_source = video_info['url']
+            narration_path = self._create_narration(text)
+            downloaded = True
+        else:
+            # Download video and create narration at the same time (both are network-bound),
+            # rendering the text image meanwhile if Pexels told us the frame size
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                download = executor.submit(self.download_video, video_info['url'], temp_video_path)
+                if video_info.get('width') and video_info.get('height'):
+                    frame_width, frame_height = _scaled_size(
+                        (video_info['width'], video_info['height']), output_height
+                    )
+                    executor.submit(
+                        self._create_text_image_with_markdown, text, frame_width,
+                        _font_size_for_height(frame_height), use_markdown=use_markdown
+                    )
+                narration_path = self._create_narration(text)
+                downloaded = download.result()
+        
+        if not downloaded:
             logger.error("Video download failed!")
             return None
+        if narration_path is None:
+            logger.error("❌ Cannot proceed without TTS - stopping video creation")
+            if temp_video_path.exists():
+                temp_video_path.unlink()
+            return None
         
         # Create final video with category folder
         if category:
@@ -1200,14 +1954,16 @@ class VideoCreator:
             output_path = self.output_dir / output_filename
         
         success = self.create_video_with_text_and_narration(
-            video_path=temp_video_path,
+            video_path=video_source,
             text=text,
             output_path=output_path,
             narration_lang=narration_lang,
             scroll_speed=scroll_speed,
             font_size=font_size,
             video_volume=video_volume,
-            use_markdown=use_markdown
+            use_markdown=use_markdown,
+            narration_path=narration_path,
+            output_height=output_height
         )
         
         # Cleanup temp video
@@ -1216,6 +1972,99 @@ class VideoCreator:
         
         return output_path if success else None
     
+    async def _fetch_background_video(self, search_query: str, orientation: str, output_path: Path) -> bool:
+        """
+        Search Pexels (falling back to a generic query) and download the video
+        
+        Returns:
+            True if the video was downloaded to output_path
+        """
+        pexels_video_info = await asyncio.to_thread(
+            self.search_pexels_video,
+            query=search_query,
+            orientation=orientation,
+            size="medium"
+        )
+        
+        if not pexels_video_info:
+            logger.warning(f"No Pexels video found for '{search_query}', trying generic search...")
+            pexels_video_info = await asyncio.to_thread(
+                self.search_pexels_video,
+                query="trending",
+                orientation=orientation,
+                size="medium"
+            )
+        
+        if not pexels_video_info:
+            logger.error("Failed to find Pexels video")
+            return False
+        
+        logger.info(f"✅ Found Pexels video: {pexels_video_info['url']}")
+        
+        download_success = await self.download_video_async(pexels_video_info['url'], output_path)
+        if not download_success or not output_path.exists():
+            logger.error("Failed to download Pexels video")
+            return False
+        
+        logger.info(f"✅ Pexels video downloaded: {output_path}")
+        return True
+    
+    def create_batch(self, jobs: list, max_workers: int = None,
+                     executor: Optional[concurrent.futures.Executor] = None) -> list:
+        """
+        Create several videos in parallel worker processes
+        
+        Each worker builds its own VideoCreator with this instance's settings and
+        works in a private temp directory, so fixed temp names like narration.mp3
+        never collide. Unless encoder_threads is configured, the cores are split
+        between the workers so parallel x264 encodes don't oversubscribe the CPU.
+        
+        Args:
+            jobs: List of keyword-argument dicts for create_video_from_pexels
+            max_workers: Process count (default: half the cores, as each FFmpeg
+                         encode is already multi-threaded)
+            executor: Long-lived process pool to submit to instead of starting
+                      one per batch (it is left running; pass its size as max_workers)
+            
+        Returns:
+            List of created video paths (None for failed jobs), in job order
+        """
+        cpu_count = os.cpu_count() or 2
+        max_workers = max_workers or max(1, cpu_count // 2)
+        
+        config = dict(self.config)
+        video_settings = dict(config.get('video_settings', {}))
+        video_settings.setdefault('encoder_threads', max(1, cpu_count // max_workers))
+        config['video_settings'] = video_settings
+        init_kwargs = {
+            'pexels_api_key': self.pexels_api_key,
+            'use_gemini_tts': self.use_gemini_tts,
+            'use_piper_tts': self.use_piper_tts,
+            'use_edge_tts': self.use_edge_tts,
+            'use_bark_tts': self.use_bark_tts,
+            'config': config
+        }
+        logger.info(f"🏭 Creating {len(jobs)} videos with {max_workers} worker processes...")
+        
+        own_executor = executor is None
+        if own_executor:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(_run_batch_job, init_kwargs, job) for job in jobs]
+            results = []
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Batch job failed ({job.get('output_filename')}): {e}")
+                    results.append(None)
+        finally:
+            if own_executor:
+                executor.shutdown()
+        
+        logger.info(f"✅ Batch finished: {sum(1 for r in results if r)}/{len(jobs)} videos created")
+        return results
+    
     async def create_video_with_gemini_tts(
         self,
         search_query: str,
@@ -1229,7 +2078,7 @@ class VideoCreator:
         
         Workflow:
         1. Generate TTS audio with Gemini (Charon voice)
-        2. Download Pexels video
+        2. Download Pexels video (at the same time as step 1)
         3. Create scrolling text overlay
         4. Loop video to match TTS duration
         5. Combine: looping video + scrolling text + TTS audio
@@ -1244,6 +2093,9 @@ class VideoCreator:
         Returns:
             Path to created video or None if failed
         """
+        # Private temp directory: create_videos_async runs several jobs at once, and
+        # their narration and background files must never collide
+        job_dir = Path(tempfile.mkdtemp(dir=self.temp_dir))
         try:
             logger.info(f"🎬 Creating video: {search_query}")
             logger.info(f"   Voice: Gemini TTS ({voice_name})")
@@ -1251,20 +2103,26 @@ class VideoCreator:
             
             # Step 1: Generate TTS with Gemini
             logger.info("🎤 Step 1: Generating TTS with Gemini...")
-            audio_path = self.temp_dir / f"tts_{search_query.replace(' ', '_')}.mp3"
+            audio_path = job_dir / "tts.mp3"
             
             if not self.gemini_analyzer:
                 logger.error("Gemini analyzer not initialized")
                 return None
             
-            # Generate TTS using Gemini
+            # Generate TTS using Gemini while the Pexels video is searched and downloaded
+            # (both steps just wait on the network)
             # Charon is a valid Gemini TTS voice (lowercase)
-            success = await self.gemini_analyzer.text_to_speech(
-                text=summary_text,
-                output_path=str(audio_path),
-                language_code="en-US",
-                voice_name=voice_name.lower(),  # Gemini voices are lowercase
-                speaking_rate=1.0
+            logger.info("📹 Step 2: Searching Pexels video (in parallel with TTS)...")
+            pexels_video_path = job_dir / "pexels.mp4"
+            success, download_success = await asyncio.gather(
+                self.gemini_analyzer.text_to_speech(
+                    text=summary_text,
+                    output_path=str(audio_path),
+                    language_code="en-US",
+                    voice_name=voice_name.lower(),  # Gemini voices are lowercase
+                    speaking_rate=1.0
+                ),
+                self._fetch_background_video(search_query, orientation, pexels_video_path)
             )
             
             if not success or not audio_path.exists():
@@ -1273,131 +2131,73 @@ class VideoCreator:
                 
             logger.info(f"✅ TTS generated: {audio_path}")
             
-            # Get TTS duration
-            audio_clip = AudioFileClip(str(audio_path))
-            tts_duration = audio_clip.duration
-            logger.info(f"   TTS duration: {tts_duration:.1f} seconds")
-            audio_clip.close()
+            if not download_success:
+                return None
             
-            # Step 2: Search and download Pexels video
-            logger.info("📹 Step 2: Searching Pexels video...")
-            pexels_video_info = self.search_pexels_video(
-                query=search_query,
-                orientation=orientation,
-                size="medium"
+            # Get TTS duration and the background video's size (looping happens inside
+            # FFmpeg) from the container headers - both ffprobe calls run at once
+            audio_info, pexels_info = await asyncio.gather(
+                asyncio.to_thread(self._probe_media, audio_path),
+                asyncio.to_thread(self._probe_media, pexels_video_path)
             )
-            
-            if not pexels_video_info:
-                logger.warning(f"No Pexels video found for '{search_query}', trying generic search...")
-                pexels_video_info = self.search_pexels_video(
-                    query="trending",
-                    orientation=orientation,
-                    size="medium"
-                )
-            
-            if not pexels_video_info:
-                logger.error("Failed to find Pexels video")
+            if not audio_info or not audio_info['duration']:
+                logger.error("Could not read TTS duration")
                 return None
+            tts_duration = audio_info['duration']
+            logger.info(f"   TTS duration: {tts_duration:.1f} seconds")
             
-            logger.info(f"✅ Found Pexels video: {pexels_video_info['url']}")
-            
-            # Download the video
-            pexels_video_path = self.temp_dir / f"pexels_{search_query.replace(' ', '_')}.mp4"
-            download_success = self.download_video(pexels_video_info['url'], pexels_video_path)
-            
-            if not download_success or not pexels_video_path.exists():
-                logger.error("Failed to download Pexels video")
+            if not pexels_info or not pexels_info['height']:
+                logger.error("Could not read Pexels video metadata")
                 return None
-                
-            logger.info(f"✅ Pexels video downloaded: {pexels_video_path}")
+            logger.info(f"   Video duration: {pexels_info['duration']:.1f}s, TTS: {tts_duration:.1f}s")
             
-            # Step 3: Loop video to match TTS duration
-            logger.info(f"🔁 Step 3: Looping video to match TTS ({tts_duration:.1f}s)...")
-            video_clip = VideoFileClip(str(pexels_video_path))
-            video_duration = video_clip.duration
-            
-            # Calculate how many loops needed
-            loops_needed = int(np.ceil(tts_duration / video_duration))
-            logger.info(f"   Video duration: {video_duration:.1f}s, loops needed: {loops_needed}")
-            
-            # Create looped video
-            if loops_needed > 1:
-                looped_video = concatenate_videoclips([video_clip] * loops_needed)
-                looped_video = looped_video.subclipped(0, tts_duration)
-            else:
-                looped_video = video_clip.subclipped(0, min(tts_duration, video_duration))
-            
-            logger.info(f"✅ Looped video created: {looped_video.duration:.1f}s")
-            
-            # Step 4: Create scrolling text overlay
-            logger.info("📝 Step 4: Creating scrolling text overlay...")
-            
-            # Get video dimensions
-            video_width, video_height = looped_video.size
+            # Scale down to the output height for the orientation (never up)
+            source_size = (pexels_info['width'], pexels_info['height'])
+            output_height = OUTPUT_HEIGHTS.get(orientation, 720)
+            video_width, video_height = _scaled_size(source_size, output_height)
             logger.info(f"   Video size: {video_width}x{video_height}")
             
-            # Create scrolling text with configurable settings
-            text_width = video_width - (self.padding_horizontal * 2)
-            txt_clip = TextClip(
+            # Step 4: Scrolling text timed to finish with the narration
+            logger.info("📝 Step 4: Preparing scrolling text overlay...")
+            scroll_speed, _ = self._calculate_optimal_scroll_speed(
                 text=summary_text,
-                font='Arial',
-                font_size=self.font_size,
-                color='white',
-                bg_color='transparent',
-                stroke_color='black',
-                stroke_width=self.stroke_width,
-                size=(text_width, None),
-                method='caption'
+                video_width=video_width,
+                video_height=video_height,
+                narration_duration=tts_duration,
+                font_size=self.font_size
             )
             
-            # Calculate scroll distance and speed
-            txt_height = txt_clip.size[1]
-            scroll_distance = video_height + txt_height
-            scroll_duration = tts_duration
-            
-            # Position function for scrolling
-            def scroll_position(t):
-                progress = t / scroll_duration
-                y = video_height - (progress * scroll_distance)
-                return (self.padding_horizontal, y)
-            
-            txt_clip = txt_clip.set_position(scroll_position)
-            txt_clip = txt_clip.set_duration(tts_duration)
-            
-            logger.info(f"✅ Scrolling text created")
-            
-            # Step 5: Composite video + text + audio
+            # Step 5: Loop video + text + TTS audio in one FFmpeg pass
             logger.info("🎭 Step 5: Combining video + text + audio...")
-            
-            final_video = CompositeVideoClip([looped_video, txt_clip], size=looped_video.size)
-            final_video = final_video.set_duration(tts_duration)
-            
-            # Add TTS audio
-            final_audio = AudioFileClip(str(audio_path))
-            final_video = final_video.set_audio(final_audio)
-            
-            # Output path
             output_path = self.output_dir / output_filename
             logger.info(f"💾 Saving video to: {output_path}")
             
-            # Write video file
-            final_video.write_videofile(
-                str(output_path),
-                codec='libx264',
-                audio_codec='aac',
-                fps=30,
-                preset='medium',
-                threads=4,
-                write_logfile=False,
-                logger=None  # Suppress moviepy logging
-            )
-            
-            # Cleanup
-            video_clip.close()
-            looped_video.close()
-            txt_clip.close()
-            final_audio.close()
-            final_video.close()
+            def render() -> bool:
+                with self._render_lock:
+                    for use_image in (True, False):
+                        if self._render_video_ffmpeg(
+                            video_path=pexels_video_path,
+                            narration_path=audio_path,
+                            output_path=output_path,
+                            duration=tts_duration,
+                            text=summary_text,
+                            video_size=source_size,
+                            font_size=self.font_size,
+                            scroll_speed=scroll_speed,
+                            use_image=use_image,
+                            output_height=output_height,
+                            narration_codec=audio_info['audio_codec'],
+                            # No credit header, and the configured caption styling
+                            include_header=False,
+                            stroke_width=self.stroke_width,
+                            padding=self.padding_horizontal
+                        ):
+                            return True
+                return False
+            
+            # Encode off the event loop so other videos keep downloading meanwhile
+            if not await asyncio.to_thread(render):
+                return None
             
             logger.info(f"✅ Video created successfully: {output_path}")
             return output_path
@@ -1410,6 +2210,59 @@ class VideoCreator:
             import traceback
             logger.error(traceback.format_exc())
             return None
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    
+    async def create_videos_async(self, jobs: list, max_concurrent: int = ASYNC_BATCH_CONCURRENCY) -> list:
+        """
+        Create several Gemini TTS videos concurrently on one event loop
+        
+        Up to max_concurrent videos synthesize narration and download their
+        backgrounds at the same time; the CPU-bound FFmpeg encodes still run
+        one after another.
+        
+        Args:
+            jobs: List of keyword-argument dicts for create_video_with_gemini_tts
+            max_concurrent: Maximum number of videos in progress at once
+            
+        Returns:
+            List of created video paths (None for failed jobs), in job order
+        
+        Raises:
+            TTSQuotaExceeded: as soon as one job runs out of TTS quota (the
+                remaining jobs are cancelled)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def run(job: dict) -> Optional[Path]:
+            async with semaphore:
+                return await self.create_video_with_gemini_tts(**job)
+        
+        logger.info(f"🏭 Creating {len(jobs)} videos, {max_concurrent} at a time...")
+        tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+        try:
+            results = await asyncio.gather(*tasks)
+        except TTSQuotaExceeded:
+            # Once the quota is gone every other job would fail the same way: cancel
+            # them and let the caller handle it, as for single videos
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        logger.info(f"✅ Batch finished: {sum(1 for r in results if r)}/{len(jobs)} videos created")
+        return results
+
+
+def _run_batch_job(init_kwargs: dict, job: dict) -> Optional[Path]:
+    """Worker process entry point for VideoCreator.create_batch"""
+    creator = VideoCreator(**init_kwargs)
+    creator.temp_dir = Path(tempfile.mkdtemp(dir=creator.temp_dir))
+    try:
+        return creator.create_video_from_pexels(**job)
+    finally:
+        shutil.rmtree(creator.temp_dir, ignore_errors=True)
 
 
 def main():
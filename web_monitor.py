@@ -4,43 +4,42 @@ Provides a simple web dashboard on port 5001
 """
 
 import asyncio
+import hashlib
 import json
+import time
 from datetime import datetime
+from itertools import islice
 from aiohttp import web
 import logging
 from pathlib import Path
 
+# orjson is much faster than stdlib json and writes bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Polled endpoints reuse their encoded body for this long
+STATS_CACHE_SECONDS = 1.0
 
-class WebMonitor:
-    """Web-based monitoring dashboard"""
-    
-    def __init__(self, agent, port=5001):
-        self.agent = agent
-        self.port = port
-        self.app = web.Application()
-        self.setup_routes()
-        self.stats = {
-            'start_time': datetime.now().isoformat(),
-            'cycles_completed': 0,
-            'articles_submitted': 0,
-            'last_cycle_time': None,
-            'last_trends_count': 0
-        }
-    
-    def setup_routes(self):
-        """Setup web routes"""
-        self.app.router.add_get('/', self.handle_index)
-        self.app.router.add_get('/api/status', self.handle_status)
-        self.app.router.add_get('/api/stats', self.handle_stats)
-        self.app.router.add_get('/api/processed', self.handle_processed)
-        self.app.router.add_get('/api/models', self.handle_models)
-        self.app.router.add_post('/api/model/select', self.handle_model_select)
-    
-    async def handle_index(self, request):
-        """Serve main dashboard page"""
-        html = """
+
+def _dumps(obj) -> bytes:
+    """Encode obj as JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json(obj) -> web.Response:
+    """JSON response (drop-in for web.json_response)"""
+    return web.Response(body=_dumps(obj), content_type='application/json')
+
+
+# Dashboard page, encoded and hashed once at import instead of on every GET
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -305,40 +304,86 @@ class WebMonitor:
 </body>
 </html>
         """
-        return web.Response(text=html, content_type='text/html')
+INDEX_BYTES = INDEX_HTML.encode('utf-8')
+INDEX_ETAG = f'"{hashlib.sha1(INDEX_BYTES).hexdigest()}"'
+INDEX_HEADERS = {'ETag': INDEX_ETAG, 'Cache-Control': 'public, max-age=300'}
+
+
+class WebMonitor:
+    """Web-based monitoring dashboard"""
+    
+    def __init__(self, agent, port=5001):
+        self.agent = agent
+        self.port = port
+        self.app = web.Application()
+        self.setup_routes()
+        self.stats = {
+            'start_time': datetime.now().isoformat(),
+            'cycles_completed': 0,
+            'articles_submitted': 0,
+            'last_cycle_time': None,
+            'last_trends_count': 0
+        }
+        # Endpoint name -> (monotonic time, encoded JSON body)
+        self._response_cache = {}
+    
+    def setup_routes(self):
+        """Setup web routes"""
+        self.app.router.add_get('/', self.handle_index)
+        self.app.router.add_get('/api/status', self.handle_status)
+        self.app.router.add_get('/api/stats', self.handle_stats)
+        self.app.router.add_get('/api/processed', self.handle_processed)
+        self.app.router.add_get('/api/models', self.handle_models)
+        self.app.router.add_post('/api/model/select', self.handle_model_select)
+    
+    async def handle_index(self, request):
+        """Serve main dashboard page"""
+        if request.headers.get('If-None-Match') == INDEX_ETAG:
+            return web.Response(status=304, headers=INDEX_HEADERS)
+        return web.Response(body=INDEX_BYTES, content_type='text/html', charset='utf-8',
+                            headers=INDEX_HEADERS)
     
     async def handle_status(self, request):
         """API endpoint for status"""
-        return web.json_response({
+        return _json({
             'status': 'running',
             'uptime_seconds': (datetime.now() - datetime.fromisoformat(self.stats['start_time'])).total_seconds()
         })
     
     async def handle_stats(self, request):
         """API endpoint for statistics"""
-        return web.json_response({
+        return self._cached_json('stats', lambda: {
             **self.stats,
             'total_processed': self.agent.url_tracker.get_count()
         })
     
     async def handle_processed(self, request):
         """API endpoint for processed URLs"""
-        return web.json_response({
+        return self._cached_json('processed', lambda: {
             'count': self.agent.url_tracker.get_count(),
-            'urls': list(self.agent.url_tracker.processed_urls)[:100]  # Return first 100
+            # Take the first 100 without copying the whole set into a list
+            'urls': list(islice(self.agent.url_tracker.processed_urls, 100))
         })
     
+    def _cached_json(self, name: str, build) -> web.Response:
+        """JSON response for build(), reusing the encoded body for STATS_CACHE_SECONDS"""
+        now = time.monotonic()
+        cached = self._response_cache.get(name)
+        if cached is None or now - cached[0] >= STATS_CACHE_SECONDS:
+            cached = self._response_cache[name] = (now, _dumps(build()))
+        return web.Response(body=cached[1], content_type='application/json')
+    
     async def handle_models(self, request):
         """API endpoint for available Ollama models"""
         try:
             models = await self.agent.llm_analyzer.list_models()
-            return web.json_response({
+            return _json({
                 'models': models,
                 'current_model': self.agent.llm_analyzer.model_name
             })
         except Exception as e:
             logger.error(f"Error getting models: {e}")
-            return web.json_response({
+            return _json({
                 'models': [],
                 'current_model': self.agent.llm_analyzer.model_name,
                 'error': str(e)
@@ -351,7 +396,7 @@ class WebMonitor:
             new_model = data.get('model')
             
             if not new_model:
-                return web.json_response({
+                return _json({
                     'success': False,
                     'error': 'No model specified'
                 })
@@ -359,13 +404,13 @@ class WebMonitor:
             # Change the model
             self.agent.llm_analyzer.set_model(new_model)
             
-            return web.json_response({
+            return _json({
                 'success': True,
                 'model': new_model
             })
         except Exception as e:
             logger.error(f"Error changing model: {e}")
-            return web.json_response({
+            return _json({
                 'success': False,
                 'error': str(e)
             })
@@ -373,6 +418,7 @@ class WebMonitor:
     def update_stats(self, **kwargs):
         """Update statistics"""
         self.stats.update(kwargs)
+        self._response_cache.clear()
     
     async def start(self):
         """Start the web server"""
@@ -3,24 +3,136 @@ Wikipedia article finder
 Searches for Wikipedia articles related to trending topics
 """
 
+import asyncio
+import json
 import logging
-import aiohttp
+import os
+import tempfile
+import threading
+import time
 import urllib.parse
-from typing import Optional
-from bs4 import BeautifulSoup
+from pathlib import Path
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from http_client import shared_session
+
+# orjson parses the (often 100KB+) API responses several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    JSON_LOADS = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    JSON_LOADS = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Wikimedia asks API clients to identify themselves
+HEADERS = {'User-Agent': 'TrendCollector/1.0 (Educational Project)'}
+
+# The API accepts 50 titles per query, but intro extracts are capped at 20 per request
+EXTRACTS_BATCH_SIZE = 20
+
+# Trending topics stay trending for hours, so their lookups are reused for a while
+LOOKUP_CACHE_TTL = 6 * 60 * 60
+
+# Article body of a Wikipedia page (navboxes, menus etc. are skipped while parsing)
+CONTENT_STRAINER = SoupStrainer('div', id='mw-content-text')
+
 
 class WikipediaFinder:
     """Find Wikipedia articles for trending topics"""
     
-    def __init__(self):
+    def __init__(self, cache_file: str = "wikipedia_cache.json"):
         self.base_url = "https://en.wikipedia.org"
         self.api_url = f"{self.base_url}/w/api.php"
+        
+        # 'article:<topic>' / 'summary:<title>' -> [unix time, result], kept on disk
+        # so a restart doesn't look every trend up again
+        self.cache_file = Path(cache_file)
+        self._cache: Dict[str, list] = self._load_cache()
+        
+        # Cache file writes run in worker threads; only the newest snapshot is kept
+        self._cache_write_lock = threading.Lock()
+        self._cache_version = 0
+        self._written_version = 0
+    
+    def _load_cache(self) -> Dict[str, list]:
+        """Load unexpired lookups from the cache file"""
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                now = time.time()
+                cache = {key: entry for key, entry in data.items() if now - entry[0] < LOOKUP_CACHE_TTL}
+                logger.info(f"Loaded {len(cache)} cached Wikipedia lookups")
+                return cache
+        except Exception as e:
+            logger.error(f"Error loading Wikipedia cache: {e}")
+        
+        return {}
+    
+    def _cached(self, key: str):
+        """Cached result for key, or None if missing or older than LOOKUP_CACHE_TTL"""
+        entry = self._cache.get(key)
+        if entry and time.time() - entry[0] < LOOKUP_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    async def _remember(self, results: Dict[str, str]):
+        """Cache lookup results and write the cache file once (off the event loop)"""
+        if not results:
+            return
+        now = time.time()
+        # Drop expired entries so the file doesn't grow forever
+        self._cache = {key: entry for key, entry in self._cache.items() if now - entry[0] < LOOKUP_CACHE_TTL}
+        for key, value in results.items():
+            self._cache[key] = [now, value]
+        try:
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self._cache)
+            else:
+                data = json.dumps(self._cache).encode('utf-8')
+            self._cache_version += 1
+            await asyncio.to_thread(self._write_cache, data, self._cache_version)
+        except Exception as e:
+            logger.error(f"Error saving Wikipedia cache: {e}")
+    
+    def _write_cache(self, data: bytes, version: int):
+        """
+        Write a cache snapshot atomically, so a crash mid-write can't corrupt the file
+        
+        Args:
+            data: Serialized cache
+            version: Snapshot number (a snapshot older than the file is skipped)
+        """
+        with self._cache_write_lock:
+            if version <= self._written_version:
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.resolve().parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._written_version = version
     
     async def find_article(self, topic: str) -> Optional[str]:
-        """Find Wikipedia article URL for a given topic"""
+        """Find Wikipedia article URL for a given topic (cached for LOOKUP_CACHE_TTL)"""
+        key = f"article:{topic.strip().casefold()}"
+        url = self._cached(key)
+        if url:
+            return url
+        
+        url = await self._find_article(topic)
+        if url:
+            await self._remember({key: url})
+        return url
+    
+    async def _find_article(self, topic: str) -> Optional[str]:
+        """Look the article URL up with the opensearch API, falling back to full-text search"""
         try:
             # First, try direct search using Wikipedia API
             params = {
@@ -31,10 +143,10 @@ class WikipediaFinder:
                 'format': 'json'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params, timeout=10) as response:
+            async with shared_session() as session:
+                async with session.get(self.api_url, params=params, headers=HEADERS, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=JSON_LOADS)
                         
                         # OpenSearch returns [query, [titles], [descriptions], [urls]]
                         if len(data) >= 4 and len(data[3]) > 0:
@@ -60,10 +172,10 @@ class WikipediaFinder:
                 'format': 'json'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params, timeout=10) as response:
+            async with shared_session() as session:
+                async with session.get(self.api_url, params=params, headers=HEADERS, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=JSON_LOADS)
                         
                         search_results = data.get('query', {}).get('search', [])
                         if search_results:
@@ -80,21 +192,26 @@ class WikipediaFinder:
     
     async def get_article_summary(self, url: str) -> str:
         """Get article summary/intro text for categorization"""
+        # Wikipedia article URLs go through the extracts API (no HTML download/parse)
+        if '/wiki/' in url:
+            title = urllib.parse.unquote(url.split('/wiki/')[-1]).replace('_', ' ')
+            summary = await self.get_summary_by_title(title)
+            if summary:
+                return summary
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
+            async with shared_session() as session:
+                async with session.get(url, headers=HEADERS, timeout=10) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        soup = BeautifulSoup(text, 'html.parser')
+                        raw = await response.read()
+                        # Only build a tree for the article body, with the C parser
+                        soup = BeautifulSoup(raw, 'lxml', parse_only=CONTENT_STRAINER)
                         
                         # Get first paragraph
-                        content_div = soup.find('div', {'id': 'mw-content-text'})
-                        if content_div:
-                            paragraphs = content_div.find_all('p', recursive=False)
-                            for p in paragraphs:
-                                text = p.get_text().strip()
-                                if len(text) > 50:  # Get first substantial paragraph
-                                    return text[:500]  # Return first 500 chars
+                        for p in soup.find_all('p'):
+                            text = p.get_text().strip()
+                            if len(text) > 50:  # Get first substantial paragraph
+                                return text[:500]  # Return first 500 chars
         except Exception as e:
             logger.error(f"Error getting article summary from {url}: {e}")
         
@@ -102,33 +219,70 @@ class WikipediaFinder:
     
     async def get_summary_by_title(self, title: str) -> str:
         """Get Wikipedia article summary using API (faster than scraping)"""
-        try:
-            params = {
-                'action': 'query',
-                'prop': 'extracts',
-                'exintro': '1',  # Use string instead of boolean
-                'explaintext': '1',  # Use string instead of boolean
-                'titles': title,
-                'format': 'json'
-            }
-            
-            headers = {
-                'User-Agent': 'TrendCollector/1.0 (Educational Project)'
-            }
+        summaries = await self.get_summaries_by_titles([title])
+        return summaries.get(title, "")
+    
+    async def get_summaries_by_titles(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Get summaries for many articles with one API request per EXTRACTS_BATCH_SIZE titles
+        
+        Args:
+            titles: Article titles (normalization and redirects are followed)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        pages = data.get('query', {}).get('pages', {})
-                        
-                        for page_id, page_data in pages.items():
-                            if page_id != '-1':  # -1 means not found
-                                extract = page_data.get('extract', '')
-                                if extract:
-                                    # Return first 500 characters
-                                    return extract[:500]
-        except Exception as e:
-            logger.error(f"Error getting summary for '{title}': {e}")
+        Returns:
+            Dict mapping each requested title to its summary (first 500 chars);
+            titles without an article are left out
+        """
+        summaries = {}
+        missing = []
+        for title in titles:
+            cached = self._cached(f"summary:{title.strip()}")
+            if cached:
+                summaries[title] = cached
+            else:
+                missing.append(title)
         
-        return ""
+        fetched = {}
+        for start in range(0, len(missing), EXTRACTS_BATCH_SIZE):
+            batch = missing[start:start + EXTRACTS_BATCH_SIZE]
+            try:
+                params = {
+                    'action': 'query',
+                    'prop': 'extracts',
+                    'exintro': '1',  # Use string instead of boolean
+                    'explaintext': '1',  # Use string instead of boolean
+                    'exlimit': 'max',
+                    'redirects': '1',
+                    'titles': '|'.join(batch),
+                    'format': 'json'
+                }
+                
+                async with shared_session() as session:
+                    async with session.get(self.api_url, params=params, headers=HEADERS, timeout=10) as response:
+                        if response.status != 200:
+                            continue
+                        data = await response.json(loads=JSON_LOADS)
+                
+                query = data.get('query', {})
+                # Requested title → normalized title → redirect target → page extract
+                normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+                redirects = {r['from']: r['to'] for r in query.get('redirects', [])}
+                extracts = {
+                    page_data.get('title'): page_data.get('extract', '')
+                    for page_id, page_data in query.get('pages', {}).items()
+                    if not page_id.startswith('-')  # -1, -2... mean not found
+                }
+                
+                for title in batch:
+                    resolved = normalized.get(title, title)
+                    resolved = redirects.get(resolved, resolved)
+                    extract = extracts.get(resolved)
+                    if extract:
+                        # Return first 500 characters
+                        fetched[title] = extract[:500]
+            except Exception as e:
+                logger.error(f"Error getting summaries for {batch}: {e}")
+        
+        await self._remember({f"summary:{title.strip()}": summary for title, summary in fetched.items()})
+        summaries.update(fetched)
+        return summaries
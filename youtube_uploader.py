@@ -4,17 +4,107 @@ Automatically uploads videos to YouTube with metadata
 """
 
 import os
+import asyncio
+import copy
+import json
 import logging
-import pickle
-from typing import Optional
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from googleapiclient.errors import HttpError
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+# The Google client libraries (googleapiclient pulls in httplib2, uritemplate,
+# discovery...) are imported in the methods that use them, so importing this
+# module stays cheap for runs that never touch YouTube
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
+# Resumable upload chunks must be a multiple of 256 KiB; bigger chunks mean fewer
+# round trips at the cost of buffering more of the file in memory
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Most IDs per videos.list call and most requests per batch HTTP request
+API_BATCH_SIZE = 50
+
+# YouTube Data API quota: units per day and the cost of each call we make
+DAILY_QUOTA = int(os.getenv('YOUTUBE_DAILY_QUOTA', 10000))
+QUOTA_COST_INSERT = 1600
+QUOTA_COST_UPDATE = 50
+QUOTA_COST_LIST = 1
+QUOTA_MAX_WAIT = 60  # Seconds to wait for quota before refusing a call
+
+# Retries per upload chunk on 5xx/429 and connection errors (with exponential
+# backoff); the resumable session picks up at the last byte the server has
+UPLOAD_CHUNK_RETRIES = 5
+
+UPLOAD_PROGRESS_STEP = 10  # Log upload progress every this many percent
+
+# Metadata limits, counted by YouTube in UTF-16 code units (an emoji is 2)
+TITLE_MAX_UNITS = 100
+DESCRIPTION_MAX_UNITS = 5000
+
+HTTP_TIMEOUT = 60  # Seconds per API request / upload chunk
+
+# Uploads in flight at once; more connections just trigger 429/5xx from Google
+MAX_CONCURRENT_UPLOADS = int(os.getenv('YOUTUBE_MAX_CONCURRENT_UPLOADS', 4))
+
+
+def _clip_utf16(text: str, max_units: int) -> str:
+    """Cut text to at most max_units UTF-16 code units, never splitting a character"""
+    # Fast path: even if every character took 2 units it would fit
+    if len(text) * 2 <= max_units or len(text.encode('utf-16-le')) <= 2 * max_units:
+        return text
+    units = 0
+    for i, char in enumerate(text):
+        units += 2 if ord(char) > 0xFFFF else 1
+        if units > max_units:
+            return text[:i]
+    return text
+
+
+def _has_shorts_tag(description: str) -> bool:
+    """Whether the description already has the #Shorts hashtag (any case, not #shortsfilm)"""
+    return any(word.rstrip('.,;:!?') == '#shorts' for word in description.casefold().split())
+
+
+class _QuotaBucket:
+    """
+    Token bucket that paces API calls to the daily quota
+    
+    The bucket starts full and refills continuously at capacity per day, so bursts
+    are allowed but a call that would overrun the quota is refused locally
+    instead of failing with quotaExceeded after a round trip.
+    """
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate  # Units per second
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consume(self, cost: float, max_wait: float = QUOTA_MAX_WAIT) -> bool:
+        """
+        Take cost units, sleeping up to max_wait seconds for them to refill
+        
+        Returns:
+            True if the units were taken, False if they would not be there in time
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = (cost - self.tokens) / self.rate
+            if wait > max_wait:
+                return False
+            # Reserve the units now; the balance may go negative until they refill
+            self.tokens -= cost
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
 
 class YouTubeUploader:
     """Upload videos to YouTube"""
@@ -22,6 +112,13 @@ class YouTubeUploader:
     # YouTube API scopes
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
     
+    # Parts of the videos.insert body
+    _INSERT_PARTS = 'snippet,status'
+    
+    # One quota per project, shared by every uploader in the process
+    _quota = _QuotaBucket(DAILY_QUOTA, DAILY_QUOTA / 86400)
+    _upload_slots = threading.BoundedSemaphore(MAX_CONCURRENT_UPLOADS)
+    
     def __init__(self, credentials_file='youtube_credentials.json'):
         """
         Initialize YouTube uploader
@@ -31,9 +128,20 @@ class YouTubeUploader:
                              Get from: https://console.cloud.google.com/apis/credentials
         """
         self.credentials_file = credentials_file
-        self.token_file = 'youtube_token.pickle'
+        self.token_file = 'youtube_token.json'
+        self.legacy_token_file = 'youtube_token.pickle'  # Written by older versions
         self.youtube = None
+        self.credentials = None
         self.authenticated = False
+        # One authorized connection pool per thread (httplib2 is not thread-safe)
+        self._local = threading.local()
+        
+        # Last videos.list snippet per video as {video_id: [etag, snippet]}, so
+        # unchanged snippets come back as a cheap 304 Not Modified
+        self.snippet_cache_file = 'youtube_snippets.json'
+        self._snippets = self._load_snippets()
+        # Uploads and updates can run in several threads; one writer at a time
+        self._snippets_lock = threading.Lock()
         
     def authenticate(self) -> bool:
         """
@@ -42,13 +150,17 @@ class YouTubeUploader:
         Returns:
             True if authentication successful
         """
+        # The API client is built once and kept while its credentials are valid
+        if self.youtube is not None and self.credentials and self.credentials.valid:
+            return True
+        
         try:
-            creds = None
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            from google.auth.transport.requests import Request
+            from googleapiclient.discovery import build
             
-            # Load saved credentials
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'rb') as token:
-                    creds = pickle.load(token)
+            # Load saved credentials (a pickled token is rewritten as JSON below)
+            creds, migrate = self._load_token()
             
             # Refresh or get new credentials
             if not creds or not creds.valid:
@@ -56,23 +168,27 @@ class YouTubeUploader:
                     logger.info("Refreshing YouTube credentials...")
                     creds.refresh(Request())
                 else:
-                    if not os.path.exists(self.credentials_file):
+                    try:
+                        flow = InstalledAppFlow.from_client_secrets_file(
+                            self.credentials_file, self.SCOPES
+                        )
+                    except FileNotFoundError:
                         logger.error(f"Credentials file not found: {self.credentials_file}")
                         logger.error("Please download OAuth2 credentials from Google Cloud Console")
                         return False
                     
                     logger.info("Starting YouTube OAuth flow...")
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.credentials_file, self.SCOPES
-                    )
                     creds = flow.run_local_server(port=8080)
                 
-                # Save credentials
-                with open(self.token_file, 'wb') as token:
-                    pickle.dump(creds, token)
+                self._save_token(creds)
+            elif migrate:
+                self._save_token(creds)
             
-            # Build YouTube API client
-            self.youtube = build('youtube', 'v3', credentials=creds)
+            # Build YouTube API client from the discovery document bundled with
+            # googleapiclient (no discovery fetch, no file cache lookup)
+            self.credentials = creds
+            self.youtube = build('youtube', 'v3', http=self._http(),
+                                 static_discovery=True, cache_discovery=False)
             self.authenticated = True
             logger.info("YouTube authentication successful")
             return True
@@ -81,6 +197,52 @@ class YouTubeUploader:
             logger.error(f"YouTube authentication failed: {e}")
             return False
     
+    def _http(self):
+        """
+        Authorized HTTP client of the calling thread, reused for all its API calls
+        
+        Keeping it alive keeps the TLS connection to Google open between requests;
+        each thread gets its own because httplib2 connections can't be shared.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None or http.credentials is not self.credentials:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            http = self._local.http = AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT)
+            )
+        return http
+    
+    def _load_token(self) -> tuple:
+        """
+        Load saved credentials (JSON, or the pickle file of older versions)
+        
+        Returns:
+            (credentials or None, True if they came from the legacy pickle file)
+        """
+        from google.oauth2.credentials import Credentials
+        
+        try:
+            with open(self.token_file, 'r', encoding='utf-8') as token:
+                return Credentials.from_authorized_user_info(json.load(token), self.SCOPES), False
+        except FileNotFoundError:
+            pass
+        
+        try:
+            with open(self.legacy_token_file, 'rb') as token:
+                import pickle
+                logger.info("Migrating pickled YouTube token to JSON...")
+                return pickle.load(token), True
+        except FileNotFoundError:
+            return None, False
+    
+    def _save_token(self, creds: 'Credentials'):
+        """Save credentials as JSON, replacing the token file atomically"""
+        tmp_file = f"{self.token_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_file, self.token_file)
+    
     def upload_video(
         self,
         video_path: str,
@@ -89,7 +251,8 @@ class YouTubeUploader:
         tags: list = None,
         category_id: str = "22",  # People & Blogs
         privacy_status: str = "public",  # public, private, or unlisted
-        is_shorts: bool = True  # Upload as YouTube Shorts
+        is_shorts: bool = True,  # Upload as YouTube Shorts
+        chunk_size: int = UPLOAD_CHUNK_SIZE
     ) -> Optional[str]:
         """
         Upload video to YouTube (optimized for Shorts)
@@ -102,31 +265,35 @@ class YouTubeUploader:
             category_id: YouTube category ID
             privacy_status: Privacy setting
             is_shorts: Upload as YouTube Shorts (adds #Shorts tag)
+            chunk_size: Bytes sent per request (a multiple of 256 KiB)
         
         Returns:
             Video ID if successful, None otherwise
+        
+        Raises:
+            ValueError: If chunk_size is not a positive multiple of 256 KiB
         """
+        if chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_ALIGNMENT:
+            raise ValueError(f"chunk_size must be a positive multiple of {UPLOAD_CHUNK_ALIGNMENT} bytes, got {chunk_size}")
+        
         if not self.authenticated:
             logger.error("Not authenticated with YouTube")
             if not self.authenticate():
                 return None
         
-        if not os.path.exists(video_path):
-            logger.error(f"Video file not found: {video_path}")
-            return None
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import MediaFileUpload
         
         try:
             # Add #Shorts hashtag for Shorts videos
-            final_description = description
-            if is_shorts:
-                if '#Shorts' not in description and '#shorts' not in description:
-                    final_description = f"{description}\n\n#Shorts"
+            needs_tag = is_shorts and not _has_shorts_tag(description)
+            final_description = f"{description}\n\n#Shorts" if needs_tag else description
             
             # Prepare video metadata
             body = {
                 'snippet': {
-                    'title': title[:100],  # YouTube limit
-                    'description': final_description[:5000],  # YouTube limit
+                    'title': _clip_utf16(title, TITLE_MAX_UNITS),  # YouTube limit
+                    'description': _clip_utf16(final_description, DESCRIPTION_MAX_UNITS),  # YouTube limit
                     'tags': tags or [],
                     'categoryId': category_id
                 },
@@ -136,28 +303,36 @@ class YouTubeUploader:
                 }
             }
             
-            # Prepare media file
-            media = MediaFileUpload(
-                video_path,
-                mimetype='video/*',
-                resumable=True,
-                chunksize=1024*1024  # 1MB chunks
-            )
-            
-            # Execute upload
-            logger.info(f"Uploading video to YouTube: {title}")
-            request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
-            
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.info(f"Upload progress: {progress}%")
+            # Prepare media file (waiting for a free upload slot if
+            # MAX_CONCURRENT_UPLOADS are running)
+            with self._upload_slots:
+                media = MediaFileUpload(
+                    video_path,
+                    mimetype='video/*',
+                    resumable=True,
+                    chunksize=chunk_size
+                )
+                
+                if not self._quota.consume(QUOTA_COST_INSERT):
+                    logger.error("⚠️  YouTube API quota exhausted, skipping upload")
+                    return None
+                
+                # Execute upload
+                logger.info(f"Uploading video to YouTube: {title}")
+                request = self.youtube.videos().insert(
+                    part=self._INSERT_PARTS,
+                    body=body,
+                    media_body=media
+                )
+                
+                response = None
+                next_log = UPLOAD_PROGRESS_STEP
+                while response is None:
+                    status, response = request.next_chunk(http=self._http(), num_retries=UPLOAD_CHUNK_RETRIES)
+                    if status and status.progress() * 100 >= next_log:
+                        progress = int(status.progress() * 100)
+                        logger.info(f"Upload progress: {progress}%")
+                        next_log = (progress // UPLOAD_PROGRESS_STEP + 1) * UPLOAD_PROGRESS_STEP
             
             video_id = response['id']
             video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -168,6 +343,9 @@ class YouTubeUploader:
             
             return video_id
             
+        except FileNotFoundError:
+            logger.error(f"Video file not found: {video_path}")
+            return None
         except HttpError as e:
             logger.error(f"YouTube API error: {e}")
             return None
@@ -175,21 +353,38 @@ class YouTubeUploader:
             logger.error(f"Error uploading video: {e}")
             return None
     
+    async def upload_video_async(self, *args, **kwargs) -> Optional[str]:
+        """
+        Upload a video without blocking the event loop
+        
+        Takes the same arguments as upload_video, which runs in a worker thread;
+        several uploads can be gathered (up to MAX_CONCURRENT_UPLOADS run at once).
+        
+        Returns:
+            Video ID if successful, None otherwise
+        """
+        return await asyncio.to_thread(self.upload_video, *args, **kwargs)
+    
     def update_video(
         self,
         video_id: str,
         title: str = None,
         description: str = None,
-        tags: list = None
+        tags: list = None,
+        category_id: str = None
     ) -> bool:
         """
         Update video metadata
         
+        The current snippet is fetched first so fields that are not given are kept;
+        with all four fields given it is replaced directly, saving the request.
+        
         Args:
             video_id: YouTube video ID
             title: New title
             description: New description
             tags: New tags
+            category_id: New category ID
         
         Returns:
             True if successful
@@ -199,25 +394,22 @@ class YouTubeUploader:
                 return False
         
         try:
-            # Get current video details
-            video = self.youtube.videos().list(
-                part='snippet',
-                id=video_id
-            ).execute()
-            
-            if not video['items']:
-                logger.error(f"Video not found: {video_id}")
+            full_snippet = title and description is not None and tags is not None and category_id
+            cost = QUOTA_COST_UPDATE if full_snippet else QUOTA_COST_UPDATE + QUOTA_COST_LIST
+            if not self._quota.consume(cost):
+                logger.error("⚠️  YouTube API quota exhausted, skipping update")
                 return False
             
-            snippet = video['items'][0]['snippet']
+            if full_snippet:
+                snippet = {'categoryId': category_id}
+            else:
+                # Get current video details
+                snippet = self._get_snippet(video_id)
+                if snippet is None:
+                    logger.error(f"Video not found: {video_id}")
+                    return False
             
-            # Update only provided fields
-            if title:
-                snippet['title'] = title[:100]
-            if description:
-                snippet['description'] = description[:5000]
-            if tags:
-                snippet['tags'] = tags
+            self._apply_snippet_changes(snippet, title, description, tags, category_id)
             
             # Update video
             self.youtube.videos().update(
@@ -226,7 +418,7 @@ class YouTubeUploader:
                     'id': video_id,
                     'snippet': snippet
                 }
-            ).execute()
+            ).execute(http=self._http())
             
             logger.info(f"Video metadata updated: {video_id}")
             return True
@@ -235,6 +427,151 @@ class YouTubeUploader:
             logger.error(f"Error updating video: {e}")
             return False
     
+    def update_videos_batch(self, updates: list) -> dict:
+        """
+        Update the metadata of many videos with a few batched HTTP requests
+        
+        The current snippets are read with one videos.list call per 50 videos and
+        the updates are sent as multipart batches of up to 50 requests each.
+        
+        Args:
+            updates: List of dicts with 'video_id' and optional 'title',
+                     'description', 'tags', 'category_id' (as for update_video);
+                     several dicts for one video are merged into one update
+        
+        Returns:
+            Dict mapping each video ID to True if its update succeeded
+        """
+        # One update per video (a repeated request_id would abort the whole batch):
+        # later fields win, fields left as None keep the earlier value
+        merged = {}
+        for update in updates:
+            fields = merged.setdefault(update['video_id'], {})
+            fields.update((key, value) for key, value in update.items() if value is not None)
+        
+        results = dict.fromkeys(merged, False)
+        if not updates:
+            return results
+        if not self.authenticated:
+            if not self.authenticate():
+                return results
+        
+        try:
+            # Current snippets, up to 50 IDs per videos.list call
+            snippets = {}
+            video_ids = list(results)
+            for start in range(0, len(video_ids), API_BATCH_SIZE):
+                if not self._quota.consume(QUOTA_COST_LIST):
+                    logger.error("⚠️  YouTube API quota exhausted, skipping updates")
+                    return results
+                response = self.youtube.videos().list(
+                    part='snippet',
+                    id=','.join(video_ids[start:start + API_BATCH_SIZE])
+                ).execute(http=self._http())
+                for item in response.get('items', []):
+                    snippets[item['id']] = item['snippet']
+            
+            def on_response(request_id, response, exception):
+                if exception is not None:
+                    logger.error(f"Error updating video {request_id}: {exception}")
+                else:
+                    results[request_id] = True
+            
+            requests = []
+            for video_id, update in merged.items():
+                snippet = snippets.get(video_id)
+                if snippet is None:
+                    logger.error(f"Video not found: {video_id}")
+                    continue
+                if not self._quota.consume(QUOTA_COST_UPDATE):
+                    logger.error("⚠️  YouTube API quota exhausted, skipping remaining updates")
+                    break
+                self._apply_snippet_changes(
+                    snippet, update.get('title'), update.get('description'),
+                    update.get('tags'), update.get('category_id')
+                )
+                requests.append((video_id, self.youtube.videos().update(
+                    part='snippet',
+                    body={'id': video_id, 'snippet': snippet}
+                )))
+            
+            for start in range(0, len(requests), API_BATCH_SIZE):
+                batch = self.youtube.new_batch_http_request(callback=on_response)
+                for video_id, request in requests[start:start + API_BATCH_SIZE]:
+                    batch.add(request, request_id=video_id)
+                batch.execute(http=self._http())
+            
+            logger.info(f"Video metadata updated: {sum(results.values())}/{len(results)} videos")
+            
+        except Exception as e:
+            logger.error(f"Error updating videos: {e}")
+        
+        return results
+    
+    def _get_snippet(self, video_id: str) -> Optional[dict]:
+        """
+        Current snippet of a video, revalidated against the cached copy by ETag
+        
+        Returns:
+            Snippet dict (safe to modify) or None if the video does not exist
+        """
+        from googleapiclient.errors import HttpError
+        
+        request = self.youtube.videos().list(part='snippet', id=video_id)
+        cached = self._snippets.get(video_id)
+        if cached:
+            request.headers['If-None-Match'] = cached[0]
+        
+        try:
+            video = request.execute(http=self._http())
+        except HttpError as e:
+            if cached and e.resp.status == 304:
+                return copy.deepcopy(cached[1])
+            raise
+        
+        if not video['items']:
+            return None
+        
+        snippet = video['items'][0]['snippet']
+        with self._snippets_lock:
+            self._snippets[video_id] = [video['etag'], snippet]
+            self._save_snippets()
+        return copy.deepcopy(snippet)
+    
+    def _load_snippets(self) -> dict:
+        """Load the snippet cache file"""
+        try:
+            with open(self.snippet_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading YouTube snippet cache: {e}")
+        return {}
+    
+    def _save_snippets(self):
+        """Save the snippet cache file atomically, like the token (hold _snippets_lock)"""
+        try:
+            tmp_file = f"{self.snippet_cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._snippets, f)
+            os.replace(tmp_file, self.snippet_cache_file)
+        except Exception as e:
+            logger.error(f"Error saving YouTube snippet cache: {e}")
+    
+    @staticmethod
+    def _apply_snippet_changes(snippet: dict, title: str = None, description: str = None,
+                               tags: list = None, category_id: str = None):
+        """Apply the provided metadata fields to a video snippet in place"""
+        if title:
+            snippet['title'] = _clip_utf16(title, TITLE_MAX_UNITS)
+        if description:
+            snippet['description'] = _clip_utf16(description, DESCRIPTION_MAX_UNITS)
+        if tags:
+            snippet['tags'] = tags
+        if category_id:
+            snippet['categoryId'] = category_id
+    
     def is_authenticated(self) -> bool:
         """Check if authenticated with YouTube"""
         return self.authenticated